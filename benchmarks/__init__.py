@@ -0,0 +1,5 @@
+"""
+Performance benchmarks for cdpg_anonkit.
+
+Run from the repository root with `python -m benchmarks.run_benchmarks --help`.
+"""
@@ -0,0 +1,182 @@
+from typing import Optional
+import pandas as pd
+import numpy as np
+
+# (lat, lon) centres of the clusters that coordinate clouds are drawn around
+CITY_CENTRES = np.array([
+    [12.9716, 77.5946],
+    [28.7041, 77.1025],
+    [19.0760, 72.8777],
+    [13.0827, 80.2707],
+    [22.5726, 88.3639],
+    [17.3850, 78.4867],
+    [18.5204, 73.8567],
+    [23.0225, 72.5714],
+])
+
+TIMESTAMP_FORMATS = [
+    '%Y-%m-%dT%H:%M:%S',
+    '%Y-%m-%d %H:%M:%S',
+    '%Y-%m-%d %H:%M:%S.%f',
+    '%Y/%m/%d %H:%M',
+]
+
+
+def zipf_weights(n: int, exponent: float = 1.2) -> np.ndarray:
+    """
+    Normalised Zipfian weights for n ranked items.
+
+    Parameters
+    ----------
+    n : int
+        The number of items.
+    exponent : float, optional
+        The Zipf exponent. Larger values give a more skewed distribution. Defaults to 1.2.
+
+    Returns
+    -------
+    np.ndarray
+        An array of n weights that sum to one, in decreasing order.
+    """
+    weights = 1.0 / np.arange(1, n + 1) ** exponent
+    return weights / weights.sum()
+
+
+def coordinate_cloud(n_rows: int, spread_km: float = 5.0, seed: Optional[int] = 0) -> pd.DataFrame:
+    """
+    Generate a skewed cloud of coordinates around a fixed set of city centres.
+
+    Cities are chosen with Zipfian weights and points are scattered around each centre
+    with a Gaussian of the given spread, so a few cities dominate the data.
+
+    Parameters
+    ----------
+    n_rows : int
+        The number of coordinates to generate.
+    spread_km : float, optional
+        The standard deviation of the scatter around each centre, in kilometres. Defaults to 5.
+    seed : Optional[int], optional
+        The seed for the random generator. Defaults to 0.
+
+    Returns
+    -------
+    pd.DataFrame
+        A DataFrame with float 'latitude' and 'longitude' columns and a 'location'
+        column of "[lat, lon]" strings, the format expected by format_coordinates.
+    """
+    rng = np.random.default_rng(seed)
+    city = rng.choice(len(CITY_CENTRES), size=n_rows, p=zipf_weights(len(CITY_CENTRES)))
+    offsets = rng.normal(scale=spread_km / 111.0, size=(n_rows, 2))
+    points = CITY_CENTRES[city] + offsets
+
+    latitude = pd.Series(points[:, 0].round(6), name='latitude')
+    longitude = pd.Series(points[:, 1].round(6), name='longitude')
+    location = '[' + latitude.astype(str) + ', ' + longitude.astype(str) + ']'
+    return pd.DataFrame({'latitude': latitude, 'longitude': longitude, 'location': location})
+
+
+def mixed_timestamps(n_rows: int, start: str = '2024-01-01', days: int = 30, seed: Optional[int] = 0) -> pd.Series:
+    """
+    Generate timestamp strings in a mix of formats.
+
+    Each row is formatted with one of TIMESTAMP_FORMATS chosen at random, so the
+    series has to be parsed with format='mixed'.
+
+    Parameters
+    ----------
+    n_rows : int
+        The number of timestamps to generate.
+    start : str, optional
+        The earliest timestamp. Defaults to '2024-01-01'.
+    days : int, optional
+        The number of days the timestamps are spread over. Defaults to 30.
+    seed : Optional[int], optional
+        The seed for the random generator. Defaults to 0.
+
+    Returns
+    -------
+    pd.Series
+        A Series of timestamp strings named 'timestamp'.
+    """
+    rng = np.random.default_rng(seed)
+    seconds = rng.integers(0, days * 86400, size=n_rows)
+    microseconds = rng.integers(0, 1_000_000, size=n_rows)
+    timestamps = pd.Series(
+        pd.Timestamp(start) + pd.to_timedelta(seconds, unit='s') + pd.to_timedelta(microseconds, unit='us')
+    )
+
+    fmt = rng.integers(0, len(TIMESTAMP_FORMATS), size=n_rows)
+    formatted = pd.Series(index=timestamps.index, dtype=object, name='timestamp')
+    for i, pattern in enumerate(TIMESTAMP_FORMATS):
+        mask = fmt == i
+        formatted[mask] = timestamps[mask].dt.strftime(pattern)
+    return formatted
+
+
+def zipfian_ids(n_rows: int, n_categories: int = 10_000, exponent: float = 1.2, seed: Optional[int] = 0) -> pd.Series:
+    """
+    Generate categorical ids whose frequencies follow a Zipfian distribution.
+
+    Parameters
+    ----------
+    n_rows : int
+        The number of ids to generate.
+    n_categories : int, optional
+        The number of distinct ids. Defaults to 10,000.
+    exponent : float, optional
+        The Zipf exponent. Defaults to 1.2.
+    seed : Optional[int], optional
+        The seed for the random generator. Defaults to 0.
+
+    Returns
+    -------
+    pd.Series
+        A Series of string ids named 'id'. The long tail contains many rare ids,
+        which is what suppression acts on.
+    """
+    rng = np.random.default_rng(seed)
+    ranks = rng.choice(n_categories, size=n_rows, p=zipf_weights(n_categories, exponent))
+    return pd.Series(np.char.add('id_', ranks.astype(str)), name='id').astype(object)
+
+
+def numeric_values(n_rows: int, seed: Optional[int] = 0) -> pd.Series:
+    """
+    Generate a log-normally distributed numeric column, such as income.
+
+    Parameters
+    ----------
+    n_rows : int
+        The number of values to generate.
+    seed : Optional[int], optional
+        The seed for the random generator. Defaults to 0.
+
+    Returns
+    -------
+    pd.Series
+        A Series of floats named 'value'.
+    """
+    rng = np.random.default_rng(seed)
+    return pd.Series(rng.lognormal(mean=10.5, sigma=0.6, size=n_rows).round(2), name='value')
+
+
+def sample_frame(n_rows: int, seed: Optional[int] = 0) -> pd.DataFrame:
+    """
+    Generate a DataFrame combining all of the generators above.
+
+    Parameters
+    ----------
+    n_rows : int
+        The number of rows to generate.
+    seed : Optional[int], optional
+        The seed for the random generators. Defaults to 0.
+
+    Returns
+    -------
+    pd.DataFrame
+        A DataFrame with 'latitude', 'longitude', 'location', 'timestamp', 'id' and 'value' columns.
+    """
+    df = coordinate_cloud(n_rows, seed=seed)
+    df['timestamp'] = mixed_timestamps(n_rows, seed=seed)
+    df['id'] = zipfian_ids(n_rows, seed=seed)
+    df['value'] = numeric_values(n_rows, seed=seed)
+    return df
@@ -0,0 +1,249 @@
+"""
+Throughput, peak memory and scaling benchmarks for the public functions.
+
+Example
+-------
+### Run at the default sizes and write the results to a file
+python -m benchmarks.run_benchmarks --output results.json
+
+### Fail if any benchmark is more than 25% slower than a stored baseline
+python -m benchmarks.run_benchmarks --sizes 1e4 1e5 --compare baseline.json --tolerance 0.25
+"""
+from typing import Callable, Dict, List, Optional, Tuple
+import argparse
+import datetime
+import json
+import platform
+import sys
+import time
+import tracemalloc
+import pandas as pd
+import numpy as np
+import h3
+
+import src.cdpg_anonkit as anonkit
+from src.cdpg_anonkit.sanitisation import SanitiseData
+from src.cdpg_anonkit.generalisation import GeneraliseData
+from benchmarks import generators
+
+DEFAULT_SIZES = [10_000, 100_000, 1_000_000, 10_000_000]
+
+SANITISATION_RULES = {
+    'value': {'method': 'clip', 'params': {'min_value': 10_000, 'max_value': 200_000}},
+    'location': {'method': 'hash', 'params': {'salt': 'benchmark'}},
+    'id': {'method': 'suppress', 'params': {'threshold': 5, 'replacement': 'Other'}},
+}
+
+
+def _prepare_temporal(df: pd.DataFrame) -> Tuple:
+    return (GeneraliseData.TemporalGeneraliser.format_timestamp(df['timestamp']),)
+
+
+# name -> (builds the arguments from a sample frame, the function being measured)
+BENCHMARKS: Dict[str, Tuple[Callable[[pd.DataFrame], Tuple], Callable]] = {
+    'format_coordinates': (
+        lambda df: (df['location'],),
+        GeneraliseData.SpatialGeneraliser.format_coordinates,
+    ),
+    'generalise_spatial': (
+        lambda df: (df['latitude'], df['longitude'], 8),
+        GeneraliseData.SpatialGeneraliser.generalise_spatial,
+    ),
+    'format_timestamp': (
+        lambda df: (df['timestamp'],),
+        GeneraliseData.TemporalGeneraliser.format_timestamp,
+    ),
+    'generalise_temporal': (
+        _prepare_temporal,
+        GeneraliseData.TemporalGeneraliser.generalise_temporal,
+    ),
+    'generalise_categorical': (
+        lambda df: (df['value'], 10),
+        GeneraliseData.CategoricalGeneraliser.generalise_categorical,
+    ),
+    'hash_values': (
+        lambda df: (df['id'], 'benchmark'),
+        SanitiseData.hash_values,
+    ),
+    'suppress': (
+        lambda df: (df['id'], 5, 'Other'),
+        SanitiseData.suppress,
+    ),
+    'sanitise_data': (
+        lambda df: (df, list(SANITISATION_RULES), SANITISATION_RULES),
+        SanitiseData.sanitise_data,
+    ),
+}
+
+
+def measure(func: Callable, args: Tuple, repeat: int = 3) -> Tuple[float, int]:
+    """
+    Measure the best wall time and the peak traced memory of a call.
+
+    Timing and memory are measured in separate calls, because tracemalloc slows
+    down every allocation and would distort the timings.
+
+    Parameters
+    ----------
+    func : Callable
+        The function to benchmark.
+    args : Tuple
+        The positional arguments to call it with.
+    repeat : int, optional
+        The number of timed calls. The fastest is reported. Defaults to 3.
+
+    Returns
+    -------
+    Tuple[float, int]
+        The best wall time in seconds and the peak memory allocated during the call in bytes.
+    """
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(*args)
+        timings.append(time.perf_counter() - start)
+
+    tracemalloc.start()
+    try:
+        func(*args)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return min(timings), peak
+
+
+def scaling_exponent(n_rows: List[int], seconds: List[float]) -> Optional[float]:
+    """
+    Fit the exponent b of seconds ~ n_rows ** b on a log-log scale.
+
+    A value close to 1 means linear scaling. Returns None with fewer than two sizes.
+    """
+    if len(n_rows) < 2:
+        return None
+    slope, _ = np.polyfit(np.log(n_rows), np.log(np.maximum(seconds, 1e-12)), 1)
+    return float(slope)
+
+
+def run(sizes: List[int], names: Optional[List[str]] = None, repeat: int = 3, seed: int = 0) -> Dict:
+    """
+    Run the benchmarks at each size.
+
+    Parameters
+    ----------
+    sizes : List[int]
+        The numbers of rows to benchmark at.
+    names : Optional[List[str]], optional
+        The benchmarks to run. Defaults to None, which runs all of them.
+    repeat : int, optional
+        The number of timed calls per benchmark and size. Defaults to 3.
+    seed : int, optional
+        The seed for the data generators. Defaults to 0.
+
+    Returns
+    -------
+    Dict
+        A JSON-serialisable report with 'metadata', 'results' (one record per benchmark
+        and size) and 'scaling' (the fitted scaling exponent per benchmark).
+    """
+    names = names or list(BENCHMARKS)
+    unknown = set(names) - set(BENCHMARKS)
+    if unknown:
+        raise ValueError(f"Unknown benchmarks: {sorted(unknown)}. Available benchmarks are: {list(BENCHMARKS)}")
+
+    results = []
+    for n_rows in sizes:
+        df = generators.sample_frame(n_rows, seed=seed)
+        for name in names:
+            prepare, func = BENCHMARKS[name]
+            seconds, peak = measure(func, prepare(df), repeat=repeat)
+            results.append({
+                'benchmark': name,
+                'n_rows': n_rows,
+                'seconds': seconds,
+                'rows_per_second': n_rows / seconds if seconds > 0 else float('inf'),
+                'peak_memory_bytes': peak,
+            })
+
+    scaling = {}
+    for name in names:
+        records = [r for r in results if r['benchmark'] == name]
+        scaling[name] = scaling_exponent([r['n_rows'] for r in records], [r['seconds'] for r in records])
+
+    metadata = {
+        'timestamp': datetime.datetime.now(datetime.timezone.utc).isoformat(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'cdpg_anonkit': anonkit.__version__,
+        'pandas': pd.__version__,
+        'numpy': np.__version__,
+        'h3': h3.__version__,
+        'repeat': repeat,
+        'seed': seed,
+    }
+    return {'metadata': metadata, 'results': results, 'scaling': scaling}
+
+
+def compare(report: Dict, baseline: Dict, tolerance: float = 0.25) -> List[str]:
+    """
+    Find benchmarks whose throughput fell by more than the tolerance against a baseline.
+
+    Parameters
+    ----------
+    report : Dict
+        A report produced by `run`.
+    baseline : Dict
+        An earlier report to compare against. Only benchmarks and sizes present in both are compared.
+    tolerance : float, optional
+        The allowed relative drop in rows per second. Defaults to 0.25.
+
+    Returns
+    -------
+    List[str]
+        A description of each regression. Empty if there are none.
+    """
+    reference = {(r['benchmark'], r['n_rows']): r['rows_per_second'] for r in baseline['results']}
+    regressions = []
+    for record in report['results']:
+        key = (record['benchmark'], record['n_rows'])
+        if key in reference and record['rows_per_second'] < reference[key] * (1 - tolerance):
+            regressions.append(
+                f"{key[0]} at {key[1]} rows: {record['rows_per_second']:.0f} rows/s "
+                f"against {reference[key]:.0f} rows/s in the baseline"
+            )
+    return regressions
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--sizes', nargs='+', type=float, default=DEFAULT_SIZES,
+                        help="numbers of rows to benchmark at, e.g. 1e4 1e5")
+    parser.add_argument('--benchmarks', nargs='+', default=None, choices=list(BENCHMARKS),
+                        help="benchmarks to run (default: all)")
+    parser.add_argument('--repeat', type=int, default=3, help="timed calls per benchmark and size")
+    parser.add_argument('--seed', type=int, default=0, help="seed for the data generators")
+    parser.add_argument('--output', default=None, help="write the JSON report to this file instead of stdout")
+    parser.add_argument('--compare', default=None, help="baseline JSON report to check for regressions")
+    parser.add_argument('--tolerance', type=float, default=0.25, help="allowed relative drop in throughput")
+    args = parser.parse_args(argv)
+
+    report = run([int(n) for n in args.sizes], args.benchmarks, args.repeat, args.seed)
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2)
+    else:
+        json.dump(report, sys.stdout, indent=2)
+        print()
+
+    if args.compare:
+        with open(args.compare) as f:
+            regressions = compare(report, json.load(f), args.tolerance)
+        for regression in regressions:
+            print(f"REGRESSION: {regression}", file=sys.stderr)
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -4,17 +4,55 @@ View the documentation for this project [here](https://novoneel-iudx.github.io/d
 """
 __version__ = "0.1.2"
 
+import importlib
 
 '''Functions to be exposed to user'''
-from .sanitisation import *
-from .generalisation import *
-
-__all__ = [
-    'SanitiseData',
-    'GeneraliseData',
-    'sanitise_data',
-    'format_coordinates',
-    'generalise_spatial',
-    'generalise_temporal',
-    'generalise_categorical'
-]
+# Submodules, and the pandas/numpy/h3 imports they pull in, are loaded on first
+# attribute access (PEP 562) so that importing the package stays cheap.
+# public name -> (submodule, attribute path within the submodule)
+_exports = {
+    'SanitiseData': ('sanitisation', 'SanitiseData'),
+    'GeneraliseData': ('generalisation', 'GeneraliseData'),
+    'sanitise_data': ('sanitisation', 'SanitiseData.sanitise_data'),
+    'format_coordinates': ('generalisation', 'GeneraliseData.SpatialGeneraliser.format_coordinates'),
+    'generalise_spatial': ('generalisation', 'GeneraliseData.SpatialGeneraliser.generalise_spatial'),
+    'generalise_temporal': ('generalisation', 'GeneraliseData.TemporalGeneraliser.generalise_temporal'),
+    'generalise_categorical': ('generalisation', 'GeneraliseData.CategoricalGeneraliser.generalise_categorical'),
+    'CategoricalBinner': ('generalisation', 'CategoricalBinner'),
+    'generalise_frame': ('parallel', 'generalise_frame'),
+    'PartitionedExecutor': ('parallel', 'PartitionedExecutor'),
+    'ValidateData': ('validation', 'ValidateData'),
+    'EquivalenceClassCounter': ('error_evaluation', 'EquivalenceClassCounter'),
+    'AggregateErrorAccumulator': ('error_evaluation', 'AggregateErrorAccumulator'),
+    'planar_laplace': ('differential_privacy', 'planar_laplace'),
+    'planar_laplace_to_h3': ('differential_privacy', 'planar_laplace_to_h3'),
+    'CoordinateCache': ('cache', 'CoordinateCache'),
+    'TokenVault': ('vault', 'TokenVault'),
+    'MicroBatchAnonymiser': ('streaming', 'MicroBatchAnonymiser'),
+    'InProcessSource': ('streaming', 'InProcessSource'),
+    'profile': ('instrumentation', 'profile'),
+    'add_listener': ('instrumentation', 'add_listener'),
+    'remove_listener': ('instrumentation', 'remove_listener'),
+    'StageMetrics': ('instrumentation', 'StageMetrics'),
+}
+
+_submodules = {'sanitisation', 'generalisation', 'parallel', 'streaming', 'vault', 'cache', 'validation', 'error_evaluation', 'differential_privacy', 'instrumentation'}
+
+__all__ = list(_exports)
+
+
+def __getattr__(name):
+    if name in _exports:
+        module_name, path = _exports[name]
+        value = importlib.import_module(f'.{module_name}', __name__)
+        for attribute in path.split('.'):
+            value = getattr(value, attribute)
+        globals()[name] = value
+        return value
+    if name in _submodules:
+        return importlib.import_module(f'.{name}', __name__)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__) | _submodules)
@@ -0,0 +1,180 @@
+from typing import Optional, Tuple
+import hashlib
+import os
+import tempfile
+import pandas as pd
+import numpy as np
+
+from .generalisation import GeneraliseData
+
+# bump when the layout of the cached arrays changes, so stale entries are never read
+_CACHE_VERSION = 1
+
+# the two lowercase hexadecimal digits of every byte value
+_HEX_DIGITS = np.frombuffer(''.join(f'{byte:02x}' for byte in range(256)).encode('ascii'), dtype=np.uint8).reshape(256, 2)
+
+
+def _cells_to_str(cells: np.ndarray) -> np.ndarray:
+    # the vectorised equivalent of h3.int_to_str: lowercase hexadecimal without leading zeros
+    digits = _HEX_DIGITS[cells.astype('>u8').view(np.uint8).reshape(-1, 8)]
+    return np.char.lstrip(digits.reshape(-1, 16).view('S16').ravel(), b'0').astype(str)
+
+
+class CoordinateCache:
+    """
+    An opt-in, content-addressed disk cache for parsed coordinates and H3 encodings.
+
+    Each result is stored as a `.npy` file named after a fingerprint of the input column
+    and the parameters, and is loaded back memory-mapped. Re-running the same raw data
+    through the cached functions, e.g. while tuning the other parameters of a job, then
+    skips the parsing and encoding entirely. The cache keeps its total size under
+    `max_bytes` by evicting the least recently used entries.
+
+    Parameters
+    ----------
+    directory : str
+        The directory that holds the cache files. It is created if it does not exist.
+    max_bytes : int, optional
+        The maximum total size of the cache files. Defaults to 1 GiB.
+
+    Example
+    -------
+    cache = CoordinateCache('.anonkit_cache')
+    latitude, longitude = cache.format_coordinates(df['location'])
+    df['h3_index'] = cache.generalise_spatial(latitude, longitude, 8).values
+    """
+
+    def __init__(self, directory: str, max_bytes: int = 1 << 30):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        os.makedirs(directory, exist_ok=True)
+
+    @staticmethod
+    def fingerprint(*columns: pd.Series, **params) -> str:
+        """
+        A content hash of the given columns and parameters.
+
+        The values are hashed with `pd.util.hash_pandas_object`, so the index of the
+        columns does not affect the fingerprint.
+        """
+        digest = hashlib.blake2b(digest_size=20)
+        digest.update(repr((_CACHE_VERSION, sorted(params.items()))).encode('utf-8'))
+        for column in columns:
+            digest.update(len(column).to_bytes(8, 'little'))
+            digest.update(pd.util.hash_pandas_object(column, index=False).to_numpy().tobytes())
+        return digest.hexdigest()
+
+    def format_coordinates(self, series: pd.Series) -> Tuple[pd.Series, pd.Series]:
+        """
+        Cached version of GeneraliseData.SpatialGeneraliser.format_coordinates.
+
+        Parameters
+        ----------
+        series : pd.Series
+            The series of "[lat, lon]" coordinate strings.
+
+        Returns
+        -------
+        Tuple[pd.Series, pd.Series]
+            The latitude and longitude Series, with the index and name of `series`.
+            On a hit they are copy-on-write views of the cache file, so they can be
+            modified like the uncached result without changing the cached entry.
+        """
+        key = self.fingerprint(series, function='format_coordinates')
+        coordinates = self._load(key)
+        if coordinates is None:
+            latitude, longitude = GeneraliseData.SpatialGeneraliser.format_coordinates(series)
+            coordinates = np.column_stack([latitude.to_numpy(np.float64), longitude.to_numpy(np.float64)])
+            self._store(key, coordinates)
+        # copy=False keeps the Series backed by the copy-on-write mapping of the file
+        return (
+            pd.Series(coordinates[:, 0], index=series.index, name=series.name, copy=False),
+            pd.Series(coordinates[:, 1], index=series.index, name=series.name, copy=False),
+        )
+
+    def generalise_spatial(self, latitude: pd.Series, longitude: pd.Series, spatial_resolution: int, as_int: bool = False) -> pd.Series:
+        """
+        Cached version of GeneraliseData.SpatialGeneraliser.generalise_spatial.
+
+        Parameters
+        ----------
+        latitude : pd.Series
+            The series of latitude values to be generalised.
+        longitude : pd.Series
+            The series of longitude values to be generalised.
+        spatial_resolution : int
+            The spatial resolution of the H3 index. Must be between 0 and 15.
+        as_int : bool, optional
+            If True, return the H3 indices as uint64 integers straight from the cache
+            instead of converting them to hexadecimal strings. Defaults to False.
+            The strings are formatted from the integers in a single vectorised pass,
+            so a hit costs no per-row calls into h3 either way.
+
+        Returns
+        -------
+        pd.Series
+            A series of H3 indices named 'h3_index'.
+        """
+        import h3
+
+        key = self.fingerprint(latitude, longitude, function='generalise_spatial', spatial_resolution=spatial_resolution)
+        cells = self._load(key)
+        if cells is None:
+            h3_index = GeneraliseData.SpatialGeneraliser.generalise_spatial(latitude, longitude, spatial_resolution)
+            cells = np.fromiter((h3.str_to_int(cell) for cell in h3_index), dtype=np.uint64, count=len(h3_index))
+            self._store(key, cells)
+        if as_int:
+            return pd.Series(cells, name='h3_index', copy=False)
+        return pd.Series(_cells_to_str(cells), name='h3_index')
+
+    @property
+    def size(self) -> int:
+        """The total size of the cache files in bytes."""
+        return sum(os.path.getsize(path) for path, _ in self._entries())
+
+    def clear(self) -> None:
+        """Remove every cache file."""
+        for path, _ in self._entries():
+            os.remove(path)
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, f'{key}.npy')
+
+    def _entries(self):
+        for entry in os.scandir(self.directory):
+            if entry.name.endswith('.npy'):
+                yield entry.path, entry.stat().st_mtime_ns
+
+    def _load(self, key: str) -> Optional[np.ndarray]:
+        path = self._path(key)
+        try:
+            # 'c' maps the file copy-on-write: results can be written to like fresh arrays,
+            # while the file itself is never modified
+            array = np.load(path, mmap_mode='c')
+        except (FileNotFoundError, ValueError):
+            return None
+        # the modification time records when an entry was last used
+        os.utime(path)
+        return array
+
+    def _store(self, key: str, array: np.ndarray) -> None:
+        # write to a temporary file first so that readers never see a partial entry
+        fd, temporary = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+        with os.fdopen(fd, 'wb') as f:
+            np.save(f, array)
+        os.replace(temporary, self._path(key))
+        self._evict()
+
+    def _evict(self) -> None:
+        entries = sorted(self._entries(), key=lambda entry: entry[1])
+        total = sum(os.path.getsize(path) for path, _ in entries)
+        for path, _ in entries:
+            if total <= self.max_bytes:
+                break
+            size = os.path.getsize(path)
+            try:
+                os.remove(path)
+            except OSError:
+                # the file may still be mapped by another process on some platforms
+                continue
+            total -= size
@@ -0,0 +1,9 @@
+"""
+Differentially private mechanisms.
+"""
+from .planar_laplace import (
+    lambert_w_minus1,
+    planar_laplace_radius,
+    planar_laplace,
+    planar_laplace_to_h3,
+)
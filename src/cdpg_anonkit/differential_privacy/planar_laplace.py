@@ -0,0 +1,198 @@
+from typing import Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
+import pandas as pd
+import numpy as np
+
+from ..generalisation import GeneraliseData
+
+# mean Earth radius in metres
+EARTH_RADIUS_M = 6_371_008.8
+
+
+def lambert_w_minus1(x: np.ndarray, iterations: int = 4) -> np.ndarray:
+    """
+    The lower branch W_{-1} of the Lambert W function, evaluated element-wise.
+
+    Starts from a series expansion near the branch point -1/e or an asymptotic
+    expansion near 0, then refines with Halley's method.
+
+    Parameters
+    ----------
+    x : np.ndarray
+        Values in [-1/e, 0).
+    iterations : int, optional
+        The number of Halley iterations. Defaults to 4, which reaches double precision.
+
+    Returns
+    -------
+    np.ndarray
+        W_{-1}(x), which lies in (-inf, -1].
+    """
+    x = np.asarray(x, dtype=np.float64)
+    if np.any((x < -1 / np.e - 1e-12) | (x >= 0)):
+        raise ValueError("W_{-1} is only defined on [-1/e, 0)")
+    x = np.maximum(x, -1 / np.e)
+
+    near_branch = x < -0.25
+    p = -np.sqrt(np.maximum(2 * (1 + np.e * x), 0))
+    with np.errstate(divide='ignore', invalid='ignore'):
+        log_x = np.log(-x)
+        w = np.where(near_branch, -1 + p - p ** 2 / 3 + 11 / 72 * p ** 3, log_x - np.log(-log_x))
+
+    # at the branch point w = -1 the Halley step is 0 / 0; the step is then taken as 0
+    with np.errstate(divide='ignore', invalid='ignore'):
+        for _ in range(iterations):
+            ew = np.exp(w)
+            f = w * ew - x
+            denominator = ew * (w + 1) - (w + 2) * f / (2 * w + 2)
+            w = w - np.nan_to_num(f / denominator, nan=0.0, posinf=0.0, neginf=0.0)
+    return w
+
+
+def planar_laplace_radius(uniform: np.ndarray, epsilon: float) -> np.ndarray:
+    """
+    Transform uniform draws in [0, 1) into planar Laplace radii by inverting the radial CDF.
+
+    Parameters
+    ----------
+    uniform : np.ndarray
+        Uniform random values in [0, 1).
+    epsilon : float
+        The privacy parameter per metre.
+
+    Returns
+    -------
+    np.ndarray
+        Radii in metres: -(W_{-1}((p - 1) / e) + 1) / epsilon.
+    """
+    return -(lambert_w_minus1((uniform - 1) / np.e) + 1) / epsilon
+
+
+def _perturb_chunk(latitude: np.ndarray, longitude: np.ndarray, epsilon: float, seed: np.random.SeedSequence) -> Tuple[np.ndarray, np.ndarray]:
+    rng = np.random.default_rng(seed)
+    radius = planar_laplace_radius(rng.random(len(latitude)), epsilon)
+    theta = rng.uniform(0, 2 * np.pi, len(latitude))
+
+    # project the offset in metres onto degrees around each point
+    lat_radians = np.radians(latitude)
+    delta_lat = radius * np.cos(theta) / EARTH_RADIUS_M
+    delta_lon = radius * np.sin(theta) / (EARTH_RADIUS_M * np.maximum(np.cos(lat_radians), 1e-12))
+
+    new_latitude = np.clip(latitude + np.degrees(delta_lat), -90, 90)
+    new_longitude = (longitude + np.degrees(delta_lon) + 180) % 360 - 180
+    return new_latitude, new_longitude
+
+
+def planar_laplace(
+    latitude: pd.Series,
+    longitude: pd.Series,
+    epsilon: float,
+    radius_m: float = 1.0,
+    seed: Optional[int] = None,
+    chunk_size: int = 1_000_000,
+    n_threads: int = 1
+) -> Tuple[pd.Series, pd.Series]:
+    """
+    Perturb coordinates with the planar Laplace mechanism for geo-indistinguishability.
+
+    Every point is moved in a uniformly random direction by a distance drawn from the
+    planar Laplace distribution, so that any two locations within `radius_m` metres of each
+    other are epsilon-indistinguishable. The whole array is processed with NumPy in chunks;
+    each chunk draws from its own random stream spawned from `seed`, so the result depends
+    only on the seed and the chunk size, not on the number of threads.
+
+    Parameters
+    ----------
+    latitude : pd.Series
+        The series of latitude values to be perturbed.
+    longitude : pd.Series
+        The series of longitude values to be perturbed.
+    epsilon : float
+        The privacy parameter for locations `radius_m` metres apart.
+    radius_m : float, optional
+        The distance in metres at which `epsilon` applies. Defaults to 1, i.e. epsilon per metre.
+    seed : Optional[int], optional
+        The seed for the random streams. Defaults to None, which draws fresh entropy.
+    chunk_size : int, optional
+        The number of points per random stream. Defaults to 1,000,000.
+    n_threads : int, optional
+        The number of threads processing chunks concurrently. Defaults to 1.
+
+    Returns
+    -------
+    Tuple[pd.Series, pd.Series]
+        The perturbed latitude and longitude, with the index and names of the inputs.
+        Latitudes are clipped to [-90, 90] and longitudes wrapped into [-180, 180).
+
+    Raises
+    ------
+    ValueError
+        If epsilon or radius_m is not positive, the series are of unequal length, or the
+        coordinates are out of range.
+
+    Example
+    -------
+    ### epsilon = ln(4) for locations within 200 metres
+    latitude, longitude = planar_laplace(latitude, longitude, epsilon=np.log(4), radius_m=200, seed=42)
+    """
+    if epsilon <= 0 or radius_m <= 0:
+        raise ValueError("epsilon and radius_m must be positive")
+    if len(latitude) != len(longitude):
+        raise ValueError("Latitude and longitude series must be of equal length")
+    if chunk_size < 1 or n_threads < 1:
+        raise ValueError("chunk_size and n_threads must be positive")
+
+    lat = np.asarray(latitude, dtype=np.float64)
+    lon = np.asarray(longitude, dtype=np.float64)
+    if not ((lat >= -90) & (lat <= 90)).all():
+        raise ValueError("Latitude values must be between -90 and 90.")
+    if not ((lon >= -180) & (lon <= 180)).all():
+        raise ValueError("Longitude values must be between -180 and 180.")
+
+    epsilon_per_metre = epsilon / radius_m
+    starts = range(0, len(lat), chunk_size)
+    seeds = np.random.SeedSequence(seed).spawn(len(starts))
+    new_lat = np.empty_like(lat)
+    new_lon = np.empty_like(lon)
+
+    def run(i: int) -> None:
+        start = starts[i]
+        stop = start + chunk_size
+        new_lat[start:stop], new_lon[start:stop] = _perturb_chunk(lat[start:stop], lon[start:stop], epsilon_per_metre, seeds[i])
+
+    if n_threads == 1 or len(starts) <= 1:
+        for i in range(len(starts)):
+            run(i)
+    else:
+        with ThreadPoolExecutor(max_workers=n_threads) as pool:
+            list(pool.map(run, range(len(starts))))
+
+    return (
+        pd.Series(new_lat, index=getattr(latitude, 'index', None), name=getattr(latitude, 'name', None)),
+        pd.Series(new_lon, index=getattr(longitude, 'index', None), name=getattr(longitude, 'name', None)),
+    )
+
+
+def planar_laplace_to_h3(
+    latitude: pd.Series,
+    longitude: pd.Series,
+    epsilon: float,
+    spatial_resolution: int,
+    radius_m: float = 1.0,
+    seed: Optional[int] = None,
+    chunk_size: int = 1_000_000,
+    n_threads: int = 1
+) -> pd.Series:
+    """
+    Perturb coordinates with the planar Laplace mechanism and snap them to H3 cells.
+
+    This is `planar_laplace` followed by `GeneraliseData.SpatialGeneraliser.generalise_spatial`;
+    see `planar_laplace` for the parameters.
+
+    Returns
+    -------
+    pd.Series
+        A series of H3 indices named 'h3_index'.
+    """
+    new_latitude, new_longitude = planar_laplace(latitude, longitude, epsilon, radius_m, seed, chunk_size, n_threads)
+    return GeneraliseData.SpatialGeneraliser.generalise_spatial(new_latitude, new_longitude, spatial_resolution)
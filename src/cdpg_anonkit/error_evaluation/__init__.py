@@ -0,0 +1,18 @@
+"""
+Metrics for comparing the utility and accuracy of anonymised releases.
+"""
+from .utility_metrics import (
+    EquivalenceClassCounter,
+    discernibility,
+    average_class_size,
+    suppressed_fraction,
+    spatial_information_loss,
+    temporal_information_loss,
+    categorical_information_loss,
+)
+from .accuracy_metrics import (
+    AggregateErrorAccumulator,
+    mean_absolute_error,
+    root_mean_squared_error,
+    mean_relative_error,
+)
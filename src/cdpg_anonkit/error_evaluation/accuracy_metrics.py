@@ -0,0 +1,114 @@
+from typing import Tuple, Union
+import pandas as pd
+import numpy as np
+
+ArrayLike = Union[pd.Series, np.ndarray, list]
+
+
+def _align(true_values: ArrayLike, noisy_values: ArrayLike) -> Tuple[np.ndarray, np.ndarray]:
+    # Series are matched on their index (e.g. the group keys of an aggregate); a group
+    # missing from one side counts as 0 there
+    if isinstance(true_values, pd.Series) and isinstance(noisy_values, pd.Series):
+        true_values, noisy_values = true_values.align(noisy_values, join='outer', fill_value=0)
+    true_array = np.asarray(true_values, dtype=np.float64)
+    noisy_array = np.asarray(noisy_values, dtype=np.float64)
+    if true_array.shape != noisy_array.shape:
+        raise ValueError("True and noisy values must have the same length")
+    return true_array, noisy_array
+
+
+def mean_absolute_error(true_values: ArrayLike, noisy_values: ArrayLike) -> float:
+    """
+    The mean absolute error between true and noisy aggregates.
+
+    Parameters
+    ----------
+    true_values : ArrayLike
+        The true aggregates, e.g. the counts per group.
+    noisy_values : ArrayLike
+        The released aggregates. Series are aligned on their index.
+
+    Returns
+    -------
+    float
+        The mean absolute error, or NaN if there are no values.
+    """
+    return AggregateErrorAccumulator().update(true_values, noisy_values).mean_absolute_error
+
+
+def root_mean_squared_error(true_values: ArrayLike, noisy_values: ArrayLike) -> float:
+    """
+    The root mean squared error between true and noisy aggregates.
+    """
+    return AggregateErrorAccumulator().update(true_values, noisy_values).root_mean_squared_error
+
+
+def mean_relative_error(true_values: ArrayLike, noisy_values: ArrayLike, delta: float = 1.0) -> float:
+    """
+    The mean relative error |noisy - true| / max(|true|, delta).
+
+    Parameters
+    ----------
+    true_values : ArrayLike
+        The true aggregates.
+    noisy_values : ArrayLike
+        The released aggregates.
+    delta : float, optional
+        The smallest denominator, which stops small true values from dominating. Defaults to 1.
+
+    Returns
+    -------
+    float
+        The mean relative error, or NaN if there are no values.
+    """
+    return AggregateErrorAccumulator(delta).update(true_values, noisy_values).mean_relative_error
+
+
+class AggregateErrorAccumulator:
+    """
+    Accumulate the error of noisy aggregates against true aggregates across chunks.
+
+    Only running sums are kept, so the metrics of a large sweep can be computed
+    chunk by chunk and read at any point.
+
+    Parameters
+    ----------
+    delta : float, optional
+        The smallest denominator of the relative error. Defaults to 1.
+    """
+
+    def __init__(self, delta: float = 1.0):
+        self.delta = delta
+        self.count = 0
+        self.sum_absolute_error = 0.0
+        self.sum_squared_error = 0.0
+        self.sum_relative_error = 0.0
+
+    def update(self, true_values: ArrayLike, noisy_values: ArrayLike) -> 'AggregateErrorAccumulator':
+        """
+        Add a chunk of true and noisy aggregates.
+
+        Returns
+        -------
+        AggregateErrorAccumulator
+            The accumulator itself.
+        """
+        true_array, noisy_array = _align(true_values, noisy_values)
+        error = np.abs(noisy_array - true_array)
+        self.count += len(error)
+        self.sum_absolute_error += float(error.sum())
+        self.sum_squared_error += float(np.square(error).sum())
+        self.sum_relative_error += float((error / np.maximum(np.abs(true_array), self.delta)).sum())
+        return self
+
+    @property
+    def mean_absolute_error(self) -> float:
+        return self.sum_absolute_error / self.count if self.count else float('nan')
+
+    @property
+    def root_mean_squared_error(self) -> float:
+        return float(np.sqrt(self.sum_squared_error / self.count)) if self.count else float('nan')
+
+    @property
+    def mean_relative_error(self) -> float:
+        return self.sum_relative_error / self.count if self.count else float('nan')
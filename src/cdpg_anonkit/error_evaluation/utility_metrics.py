@@ -0,0 +1,226 @@
+from typing import List, Optional, Union
+import pandas as pd
+import numpy as np
+
+from ..generalisation import CategoricalBinner
+
+MINUTES_PER_DAY = 24 * 60
+
+
+class EquivalenceClassCounter:
+    """
+    Count equivalence classes over the quasi-identifiers of a generalised dataset, chunk by chunk.
+
+    An equivalence class is a set of rows that share the same values for every
+    quasi-identifier. Only the class sizes are kept, so the counts of many chunks can be
+    accumulated and every metric in this module computed without revisiting the rows.
+
+    The counts of each chunk are queued and merged into the running counts when `counts`
+    is read, or once the queue outgrows the merged counts, so the cost of an update does
+    not grow with the number of classes seen so far.
+
+    Parameters
+    ----------
+    quasi_identifiers : List[str]
+        The columns that together identify an equivalence class, e.g. ['h3_index', 'timeslot'].
+
+    Example
+    -------
+    counter = EquivalenceClassCounter(['h3_index', 'timeslot'])
+    for chunk in chunks:
+        counter.update(chunk)
+    discernibility(counter.counts, k=5)
+    """
+
+    def __init__(self, quasi_identifiers: List[str]):
+        if not quasi_identifiers:
+            raise ValueError("At least one quasi-identifier must be given")
+        self.quasi_identifiers = list(quasi_identifiers)
+        self._counts = pd.Series(dtype='int64')
+        self._pending: List[pd.Series] = []
+        self._pending_size = 0
+
+    def update(self, df: pd.DataFrame) -> 'EquivalenceClassCounter':
+        """
+        Add the equivalence classes of a chunk to the running counts.
+
+        Rows with a null quasi-identifier form their own class, as they would in a release.
+
+        Parameters
+        ----------
+        df : pd.DataFrame
+            A chunk of the generalised dataset.
+
+        Returns
+        -------
+        EquivalenceClassCounter
+            The counter itself.
+        """
+        missing = [column for column in self.quasi_identifiers if column not in df.columns]
+        if missing:
+            raise ValueError(f"Columns {missing} not found in DataFrame")
+
+        chunk_counts = df.groupby(self.quasi_identifiers, dropna=False, observed=True).size()
+        self._pending.append(chunk_counts)
+        self._pending_size += len(chunk_counts)
+        # merging only once the queue is as large as the merged counts keeps the total work linear
+        if self._pending_size > max(len(self._counts), 1 << 16):
+            self._merge()
+        return self
+
+    @property
+    def counts(self) -> pd.Series:
+        """The size of each equivalence class seen so far, indexed by the quasi-identifiers."""
+        if self._pending:
+            self._merge()
+        return self._counts
+
+    def _merge(self) -> None:
+        combined = pd.concat([self._counts, *self._pending]) if len(self._counts) else pd.concat(self._pending)
+        levels = list(range(combined.index.nlevels))
+        self._counts = combined.groupby(level=levels, dropna=False, sort=False).sum().astype('int64')
+        self._pending = []
+        self._pending_size = 0
+
+    @property
+    def n_rows(self) -> int:
+        return int(self.counts.sum())
+
+    @property
+    def n_classes(self) -> int:
+        return len(self.counts)
+
+
+def discernibility(counts: pd.Series, k: Optional[int] = None) -> float:
+    """
+    The discernibility metric of a set of equivalence classes.
+
+    Each row is charged the size of its class, so the metric is the sum of the squared
+    class sizes. If k is given, classes smaller than k are treated as suppressed and each
+    of their rows is charged the size of the whole dataset instead.
+
+    Parameters
+    ----------
+    counts : pd.Series
+        The size of each equivalence class, e.g. EquivalenceClassCounter.counts.
+    k : Optional[int], optional
+        The k-anonymity threshold. Defaults to None, which means no class is suppressed.
+
+    Returns
+    -------
+    float
+        The discernibility. Lower is better; the minimum is the number of rows.
+    """
+    sizes = counts.to_numpy(dtype=np.float64)
+    if k is None:
+        return float(np.sum(sizes ** 2))
+    suppressed = sizes < k
+    return float(np.sum(sizes[~suppressed] ** 2) + sizes[suppressed].sum() * sizes.sum())
+
+
+def average_class_size(counts: pd.Series, k: Optional[int] = None) -> float:
+    """
+    The average equivalence class size, normalised by k if given.
+
+    With k, this is the C_avg metric (rows / classes) / k, where 1 means every class
+    has exactly k rows and larger values mean coarser generalisation than k requires.
+
+    Parameters
+    ----------
+    counts : pd.Series
+        The size of each equivalence class.
+    k : Optional[int], optional
+        The k-anonymity threshold. Defaults to None.
+
+    Returns
+    -------
+    float
+        The average class size, or NaN if there are no classes.
+    """
+    if len(counts) == 0:
+        return float('nan')
+    average = counts.sum() / len(counts)
+    return float(average / k) if k else float(average)
+
+
+def suppressed_fraction(counts: pd.Series, k: int) -> float:
+    """
+    The fraction of rows that fall in equivalence classes smaller than k.
+    """
+    total = counts.sum()
+    if total == 0:
+        return float('nan')
+    return float(counts[counts < k].sum() / total)
+
+
+def spatial_information_loss(spatial_resolution: int, domain_area_km2: Optional[float] = None) -> float:
+    """
+    The information lost by generalising locations to H3 cells of a given resolution.
+
+    Parameters
+    ----------
+    spatial_resolution : int
+        The H3 resolution, between 0 and 15.
+    domain_area_km2 : Optional[float], optional
+        The area of the region the data covers. If given, the loss is the average cell area
+        as a fraction of the region, capped at 1. Defaults to None, which returns the average
+        cell area in square kilometres.
+
+    Returns
+    -------
+    float
+        The normalised or absolute information loss.
+    """
+    import h3
+
+    if not (0 <= spatial_resolution <= 15):
+        raise ValueError("H3 Spatial resolution must be between 0 and 15.")
+    area = h3.average_hexagon_area(spatial_resolution, 'km^2')
+    if domain_area_km2 is None:
+        return float(area)
+    return float(min(area / domain_area_km2, 1.0))
+
+
+def temporal_information_loss(temporal_resolution: int) -> float:
+    """
+    The information lost by generalising timestamps to timeslots, as the fraction of a day
+    covered by one slot (generalise_temporal keeps only the time of day).
+    """
+    if temporal_resolution <= 0:
+        raise ValueError("The temporal resolution must be a positive number of minutes")
+    return float(min(temporal_resolution / MINUTES_PER_DAY, 1.0))
+
+
+def categorical_information_loss(
+    bins: Union[List[float], np.ndarray, CategoricalBinner],
+    bin_counts: Optional[Union[List[int], np.ndarray, pd.Series]] = None
+) -> float:
+    """
+    The normalised certainty penalty of binning a numeric attribute.
+
+    Each row is charged the width of its bin as a fraction of the range of all bins,
+    so the loss is 0 for bins of zero width and 1 for a single bin covering everything.
+
+    Parameters
+    ----------
+    bins : Union[List[float], np.ndarray, CategoricalBinner]
+        The bin edges, or a frozen CategoricalBinner.
+    bin_counts : Optional[Union[List[int], np.ndarray, pd.Series]], optional
+        The number of rows in each bin, e.g. from value_counts(sort=False) of the binned column.
+        Defaults to None, which weights every bin equally.
+
+    Returns
+    -------
+    float
+        The average normalised bin width.
+    """
+    edges = bins.edges if isinstance(bins, CategoricalBinner) else np.asarray(bins, dtype=np.float64)
+    if len(edges) < 2:
+        raise ValueError("At least two bin edges are needed")
+    widths = np.diff(edges) / (edges[-1] - edges[0])
+    if bin_counts is None:
+        return float(widths.mean())
+    weights = np.asarray(bin_counts, dtype=np.float64)
+    if len(weights) != len(widths):
+        raise ValueError("The number of bin counts must match the number of bins")
+    return float(np.average(widths, weights=weights)) if weights.sum() > 0 else float('nan')
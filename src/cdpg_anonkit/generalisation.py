@@ -1,7 +1,8 @@
 from typing import Tuple, Literal, Union, List, Optional, get_args
 import pandas as pd
 import numpy as np
-import h3
+
+from .instrumentation import instrumented
 
 
 
@@ -11,6 +12,7 @@ class GeneraliseData:
         # helper function to clean coordinates attribute formatting
 
         @staticmethod
+        @instrumented('format_coordinates')
         def format_coordinates(series: pd.Series) -> Tuple[pd.Series, pd.Series]:
             """
             Clean coordinates attribute formatting.
@@ -46,6 +48,7 @@ class GeneraliseData:
             return latitude, longitude
 
         @staticmethod
+        @instrumented('generalise_spatial')
         def generalise_spatial(latitude: pd.Series, longitude: pd.Series, spatial_resolution: int) -> pd.Series:
                        
             """
@@ -84,6 +87,8 @@ class GeneraliseData:
             if len(latitude) != len(longitude):
                 raise Warning("Latitude and longitude series are of unequal length! Extra values will be ignored.")
 
+            import h3  # imported here so that only spatial generalisation pays for loading h3
+
             h3_index = [
                 h3.latlng_to_cell(lat, lon, spatial_resolution)
                 for lat, lon in zip(latitude, longitude)
@@ -96,6 +101,7 @@ class GeneraliseData:
         @staticmethod     
         # TODO: Do we really need a wrapper around a standard pandas function?  
         # helper function to convert timestamp to pd.datetime object
+        @instrumented('format_timestamp')
         def format_timestamp(series: pd.Series) -> pd.Series:
             # Check if all timestamps in the series are of the same format
             """
@@ -121,6 +127,7 @@ class GeneraliseData:
         # def __init__(self):
         #     self.temporal_resolution_args = Literal[15, 30, 60]
         @staticmethod       
+        @instrumented('generalise_temporal')
         def generalise_temporal(data: Union[pd.Series, pd.DataFrame],
                                 timestamp_col: str = None,
                                 temporal_resolution: int = 60
@@ -224,7 +231,8 @@ class GeneraliseData:
     class CategoricalGeneraliser:
 
         @staticmethod
-        def generalise_categorical(data: pd.Series, bins: Union[int, List[float]], labels: Optional[List[str]] = None) -> pd.Series:
+        @instrumented('generalise_categorical')
+        def generalise_categorical(data: pd.Series, bins: Union[int, List[float], 'CategoricalBinner'], labels: Optional[List[str]] = None) -> pd.Series:
             """
             Generalise a categorical column by binning the values into categories.
 
@@ -232,15 +240,312 @@ class GeneraliseData:
             ----------
             data : pd.Series
                 The input Series to be generalised.
-            bins : Union[int, List[float]]
-                The number of bins to use, or a list of bin edges.
+            bins : Union[int, List[float], CategoricalBinner]
+                The number of bins to use, a list of bin edges, or a fitted CategoricalBinner.
+                An integer derives the edges from the range of `data`, so use a CategoricalBinner
+                when the data is processed in chunks and the categories must agree.
             labels : Optional[List[str]], optional
                 The labels to use for each bin. If not specified, the bin edges
-                will be used as labels.
+                will be used as labels. Ignored when `bins` is a CategoricalBinner,
+                which carries its own labels.
 
             Returns
             -------
             pd.Series
-                The generalised Series.
+                The generalised Series, an ordered categorical. A binner built with
+                CategoricalBinner.from_edges gives the same result as the same list of edges.
             """
-            return pd.cut(data, bins=bins, labels=labels)
\ No newline at end of file
+            if isinstance(bins, CategoricalBinner):
+                return bins.transform(data)
+            return pd.cut(data, bins=bins, labels=labels)
+
+
+class CategoricalBinner:
+    """
+    Learn bin edges across chunks of data, freeze them, and apply them to every later chunk.
+
+    Edges are learned either from a streaming quantile sketch (equal-frequency bins)
+    or from the running minimum and maximum (equal-width bins). Once frozen, the same
+    edges and labels are used for every chunk, so the categories of separately
+    processed chunks can be merged.
+
+    Bins are closed on the right, as with `pd.cut`. The lowest edge of learned bins is
+    the smallest value seen, so it is included in the first bin; binners built from
+    fixed edges exclude it by default, exactly like `pd.cut`.
+
+    Parameters
+    ----------
+    n_bins : int
+        The number of bins to learn.
+    strategy : Literal['quantile', 'uniform'], optional
+        'quantile' for equal-frequency bins or 'uniform' for equal-width bins. Defaults to 'quantile'.
+    labels : Optional[List[str]], optional
+        The labels to use for each bin. If not specified, the bin intervals are used as labels.
+    sketch_size : int, optional
+        The number of points kept by the quantile sketch. Larger sketches give more
+        accurate edges. Defaults to 2048.
+    open_ends : bool, optional
+        If True, values outside the learned range fall into the first or last bin.
+        Otherwise they become NaN. Defaults to False.
+    include_lowest : bool, optional
+        If True, the lowest edge belongs to the first bin, as with `pd.cut(..., include_lowest=True)`.
+        Defaults to True.
+
+    Example
+    -------
+    binner = CategoricalBinner(n_bins=4)
+    for chunk in chunks:
+        binner.partial_fit(chunk['income'])
+    binner.freeze()
+    for chunk in chunks:
+        chunk['income'] = binner.transform(chunk['income'])
+    """
+
+    def __init__(
+        self,
+        n_bins: int,
+        strategy: Literal['quantile', 'uniform'] = 'quantile',
+        labels: Optional[List[str]] = None,
+        sketch_size: int = 2048,
+        open_ends: bool = False,
+        include_lowest: bool = True
+    ):
+        if n_bins < 1:
+            raise ValueError("n_bins must be a positive integer")
+        if strategy not in get_args(Literal['quantile', 'uniform']):
+            raise ValueError(f"'{strategy}' is not a valid strategy, please choose 'quantile' or 'uniform'")
+        if labels is not None and len(labels) != n_bins:
+            raise ValueError("The number of labels must match the number of bins")
+
+        self.n_bins = n_bins
+        self.strategy = strategy
+        self.labels = labels
+        self.sketch_size = sketch_size
+        self.open_ends = open_ends
+        self.include_lowest = include_lowest
+
+        self._values = np.empty(0)
+        self._weights = np.empty(0)
+        self._min = np.inf
+        self._max = -np.inf
+        self._edges = None
+        self._categories = None
+
+    @classmethod
+    def from_edges(
+        cls,
+        edges: List[float],
+        labels: Optional[List[str]] = None,
+        open_ends: bool = False,
+        include_lowest: bool = False
+    ) -> 'CategoricalBinner':
+        """
+        Create a frozen binner from fixed bin edges.
+
+        Parameters
+        ----------
+        edges : List[float]
+            The bin edges, in increasing order.
+        labels : Optional[List[str]], optional
+            The labels to use for each bin. If not specified, the bin intervals are used as labels.
+        open_ends : bool, optional
+            If True, values outside the edges fall into the first or last bin. Defaults to False.
+        include_lowest : bool, optional
+            If True, the lowest edge belongs to the first bin. Defaults to False, so that the
+            binner gives the same result as `pd.cut` with the same edges.
+
+        Returns
+        -------
+        CategoricalBinner
+            A binner that is ready to transform data.
+        """
+        edges = np.asarray(edges, dtype=np.float64)
+        if edges.ndim != 1 or len(edges) < 2 or not (np.diff(edges) > 0).all():
+            raise ValueError("Bin edges must be a list of at least two strictly increasing values")
+        binner = cls(len(edges) - 1, labels=labels, open_ends=open_ends, include_lowest=include_lowest)
+        binner._set_edges(edges)
+        return binner
+
+    @property
+    def frozen(self) -> bool:
+        return self._edges is not None
+
+    @property
+    def edges(self) -> np.ndarray:
+        if not self.frozen:
+            raise ValueError("The binner has not been frozen yet")
+        return self._edges
+
+    @property
+    def categories(self) -> pd.Index:
+        if not self.frozen:
+            raise ValueError("The binner has not been frozen yet")
+        return self._categories
+
+    def partial_fit(self, data: pd.Series) -> 'CategoricalBinner':
+        """
+        Update the learned statistics with a chunk of data.
+
+        Parameters
+        ----------
+        data : pd.Series
+            A chunk of numeric data. NaN values are ignored.
+
+        Returns
+        -------
+        CategoricalBinner
+            The binner itself.
+        """
+        if self.frozen:
+            raise ValueError("The binner is frozen and cannot learn from more data")
+
+        values = np.asarray(data, dtype=np.float64)
+        values = values[~np.isnan(values)]
+        if len(values) == 0:
+            return self
+
+        self._min = min(self._min, values.min())
+        self._max = max(self._max, values.max())
+
+        if self.strategy == 'quantile':
+            values = np.sort(values)
+            weights = np.ones(len(values))
+            if len(values) > self.sketch_size:
+                values, weights = self._compress(values, weights)
+            self._values = np.concatenate([self._values, values])
+            self._weights = np.concatenate([self._weights, weights])
+            if len(self._values) > 2 * self.sketch_size:
+                order = np.argsort(self._values, kind='stable')
+                self._values, self._weights = self._compress(self._values[order], self._weights[order])
+        return self
+
+    def merge(self, other: 'CategoricalBinner') -> 'CategoricalBinner':
+        """
+        Combine the statistics learned by another binner, e.g. one fitted on another partition.
+
+        Returns
+        -------
+        CategoricalBinner
+            The binner itself.
+        """
+        if self.frozen or other.frozen:
+            raise ValueError("Frozen binners cannot be merged")
+        if (self.n_bins, self.strategy) != (other.n_bins, other.strategy):
+            raise ValueError("Only binners with the same number of bins and strategy can be merged")
+
+        self._min = min(self._min, other._min)
+        self._max = max(self._max, other._max)
+        self._values = np.concatenate([self._values, other._values])
+        self._weights = np.concatenate([self._weights, other._weights])
+        if len(self._values) > 2 * self.sketch_size:
+            order = np.argsort(self._values, kind='stable')
+            self._values, self._weights = self._compress(self._values[order], self._weights[order])
+        return self
+
+    def freeze(self) -> 'CategoricalBinner':
+        """
+        Compute the bin edges from the learned statistics and fix them.
+
+        Heavily tied data can produce repeated quantile edges. These are collapsed,
+        which leaves fewer bins than requested.
+
+        Returns
+        -------
+        CategoricalBinner
+            The binner itself.
+
+        Raises
+        ------
+        ValueError
+            If no data has been seen, or if collapsed edges no longer match the given labels.
+        """
+        if self.frozen:
+            return self
+        if not np.isfinite(self._min):
+            raise ValueError("Cannot freeze a binner that has not seen any data")
+
+        if self.strategy == 'uniform' or self._min == self._max:
+            edges = np.linspace(self._min, self._max, self.n_bins + 1)
+            if self._min == self._max:
+                # widen a constant column so that its value falls inside a bin, as pd.cut does
+                edges = np.linspace(self._min - 0.001 * abs(self._min or 1), self._max + 0.001 * abs(self._max or 1), self.n_bins + 1)
+        else:
+            order = np.argsort(self._values, kind='stable')
+            values, weights = self._values[order], self._weights[order]
+            cumulative = np.cumsum(weights) - weights / 2
+            targets = np.linspace(0, 1, self.n_bins + 1)[1:-1] * weights.sum()
+            inner = np.interp(targets, cumulative, values)
+            edges = np.unique(np.concatenate([[self._min], inner, [self._max]]))
+
+        if self.labels is not None and len(edges) - 1 != len(self.labels):
+            raise ValueError(
+                f"The learned edges give {len(edges) - 1} bins, which does not match the {len(self.labels)} labels"
+            )
+        self._set_edges(edges)
+        return self
+
+    def fit(self, data: pd.Series) -> 'CategoricalBinner':
+        """
+        Learn the edges from a single dataset and freeze them.
+        """
+        return self.partial_fit(data).freeze()
+
+    def encode(self, data: pd.Series) -> np.ndarray:
+        """
+        Map values to compact integer bin codes.
+
+        Parameters
+        ----------
+        data : pd.Series
+            The numeric data to encode.
+
+        Returns
+        -------
+        np.ndarray
+            The bin code of each value, in the smallest integer type that fits.
+            Values that are NaN or outside the edges (unless open_ends is set) are coded -1.
+        """
+        edges = self.edges
+        values = np.asarray(data, dtype=np.float64)
+        codes = np.searchsorted(edges, values, side='left') - 1
+        if self.include_lowest:
+            codes[values == edges[0]] = 0
+        n_bins = len(edges) - 1
+        if self.open_ends:
+            codes = np.clip(codes, 0, n_bins - 1)
+        else:
+            codes[codes >= n_bins] = -1
+        codes[np.isnan(values)] = -1
+        return codes.astype(np.min_scalar_type(-n_bins))
+
+    def transform(self, data: pd.Series) -> pd.Series:
+        """
+        Bin a chunk of data using the frozen edges.
+
+        Parameters
+        ----------
+        data : pd.Series
+            The numeric data to bin.
+
+        Returns
+        -------
+        pd.Series
+            An ordered categorical Series, like the result of `pd.cut`, with the same index
+            and name as `data`, whose categories are the same for every chunk.
+        """
+        categorical = pd.Categorical.from_codes(self.encode(data), categories=self.categories, ordered=True)
+        return pd.Series(categorical, index=getattr(data, 'index', None), name=getattr(data, 'name', None))
+
+    def _compress(self, values: np.ndarray, weights: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        # summarise sorted weighted points by sketch_size equally weighted quantile points
+        cumulative = np.cumsum(weights) - weights / 2
+        total = weights.sum()
+        targets = (np.arange(self.sketch_size) + 0.5) / self.sketch_size * total
+        return np.interp(targets, cumulative, values), np.full(self.sketch_size, total / self.sketch_size)
+
+    def _set_edges(self, edges: np.ndarray) -> None:
+        self._edges = edges
+        if self.labels is not None:
+            self._categories = pd.Index(self.labels)
+        else:
+            self._categories = pd.IntervalIndex.from_breaks(edges, closed='right')
\ No newline at end of file
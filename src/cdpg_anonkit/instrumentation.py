@@ -0,0 +1,306 @@
+from typing import Callable, Dict, List, Optional, Union
+from contextlib import contextmanager
+from dataclasses import dataclass, asdict
+import functools
+import json
+import time
+import tracemalloc
+import pandas as pd
+
+
+@dataclass
+class StageMetrics:
+    """
+    Measurements for a single run of an instrumented stage.
+
+    Attributes
+    ----------
+    stage : str
+        The name of the stage, e.g. 'generalise_spatial' or 'sanitise_data.hash'.
+    column : Optional[str]
+        The column the stage was applied to, if known.
+    wall_time : float
+        The wall time of the stage in seconds.
+    n_rows : int
+        The number of input rows.
+    rows_per_second : float
+        The throughput of the stage.
+    input_cardinality : Optional[int]
+        The number of distinct input values, if cardinality tracking is enabled.
+    peak_memory_delta : Optional[int]
+        The peak memory allocated during the stage in bytes, if memory tracking is enabled.
+    """
+    stage: str
+    column: Optional[str]
+    wall_time: float
+    n_rows: int
+    rows_per_second: float
+    input_cardinality: Optional[int] = None
+    peak_memory_delta: Optional[int] = None
+
+
+class _Listener:
+    def __init__(self, callback: Callable[[StageMetrics], None], track_cardinality: bool, track_memory: bool):
+        self.callback = callback
+        self.track_cardinality = track_cardinality
+        self.track_memory = track_memory
+
+
+# the instrumented functions only do extra work while this list is non-empty
+_listeners: List[_Listener] = []
+
+
+class _MemoryFrame:
+    def __init__(self, memory_before: int, peak_before: int, owns_peak: bool):
+        self.memory_before = memory_before
+        self.peak_before = peak_before
+        self.peak = peak_before
+        self.owns_peak = owns_peak
+
+
+# the stages currently measuring memory, innermost last
+_memory_frames: List[_MemoryFrame] = []
+
+
+def _fold_peak() -> None:
+    # record the tracemalloc peak so far in every open stage before it is reset or read
+    _, peak = tracemalloc.get_traced_memory()
+    for frame in _memory_frames:
+        frame.peak = max(frame.peak, peak)
+
+
+def add_listener(callback: Callable[[StageMetrics], None], track_cardinality: bool = False, track_memory: bool = False) -> None:
+    """
+    Register a callback that receives the metrics of every instrumented stage.
+
+    Parameters
+    ----------
+    callback : Callable[[StageMetrics], None]
+        The function called with a StageMetrics record after each stage.
+    track_cardinality : bool, optional
+        If True, count the distinct input values of each stage. This costs a hashing
+        pass over the input. Defaults to False.
+    track_memory : bool, optional
+        If True, measure the peak memory of each stage with tracemalloc, which slows
+        down allocations while it is active. Defaults to False.
+    """
+    _listeners.append(_Listener(callback, track_cardinality, track_memory))
+
+
+def remove_listener(callback: Callable[[StageMetrics], None]) -> None:
+    """
+    Unregister a callback added with add_listener.
+
+    Raises
+    ------
+    ValueError
+        If the callback is not registered.
+    """
+    for listener in _listeners:
+        if listener.callback == callback:
+            _listeners.remove(listener)
+            return
+    raise ValueError("Callback is not registered")
+
+
+def _escape_label(value: str) -> str:
+    # label values in the Prometheus text format escape backslash, double quote and line feed
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _rows_and_cardinality(data, track_cardinality: bool):
+    if isinstance(data, pd.DataFrame):
+        return len(data), None
+    if isinstance(data, pd.Series):
+        return len(data), int(data.nunique()) if track_cardinality else None
+    return 0, None
+
+
+@contextmanager
+def stage(name: str, data: Union[pd.Series, pd.DataFrame, None] = None, column: Optional[str] = None):
+    """
+    Measure the enclosed block as a stage and report it to the registered listeners.
+
+    When no listener is registered the block runs without any measurement.
+
+    Memory is measured with the tracemalloc peak. If tracing was started outside the
+    instrumented stages, e.g. by a benchmark, the peak is never reset so that the outer
+    measurement stays intact; the peak memory delta of a stage is then only known, and
+    otherwise None, when the stage raises the overall peak.
+
+    Parameters
+    ----------
+    name : str
+        The name of the stage.
+    data : Union[pd.Series, pd.DataFrame, None], optional
+        The input of the stage, used for the row count and cardinality.
+    column : Optional[str], optional
+        The column the stage is applied to.
+    """
+    if not _listeners:
+        yield
+        return
+
+    listeners = list(_listeners)
+    track_cardinality = any(listener.track_cardinality for listener in listeners)
+    track_memory = any(listener.track_memory for listener in listeners)
+    n_rows, cardinality = _rows_and_cardinality(data, track_cardinality)
+
+    started_tracing = False
+    if track_memory:
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+            started_tracing = True
+        # the peak may only be reset if an instrumented stage owns the tracing; the peak
+        # so far is folded into the enclosing stages first, so their measurements survive
+        owns_peak = started_tracing or bool(_memory_frames and _memory_frames[0].owns_peak)
+        if owns_peak:
+            _fold_peak()
+            tracemalloc.reset_peak()
+        frame = _MemoryFrame(*tracemalloc.get_traced_memory(), owns_peak)
+        _memory_frames.append(frame)
+
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        wall_time = time.perf_counter() - start
+        peak_memory_delta = None
+        if track_memory:
+            _fold_peak()
+            _memory_frames.pop()
+            if frame.owns_peak or frame.peak > frame.peak_before:
+                peak_memory_delta = frame.peak - frame.memory_before
+            if started_tracing:
+                tracemalloc.stop()
+
+    metrics = StageMetrics(
+        stage=name,
+        column=column,
+        wall_time=wall_time,
+        n_rows=n_rows,
+        rows_per_second=n_rows / wall_time if wall_time > 0 else float('inf'),
+        input_cardinality=cardinality,
+        peak_memory_delta=peak_memory_delta,
+    )
+    for listener in listeners:
+        listener.callback(metrics)
+
+
+def instrumented(name: str) -> Callable:
+    """
+    Decorator that runs a function as a stage of the given name.
+
+    The first Series or DataFrame argument is taken as the input of the stage.
+    """
+    def decorator(func: Callable) -> Callable:
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not _listeners:
+                return func(*args, **kwargs)
+            data = next(
+                (arg for arg in (*args, *kwargs.values()) if isinstance(arg, (pd.Series, pd.DataFrame))),
+                None
+            )
+            with stage(name, data):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+class profile:
+    """
+    Context manager that collects the metrics of every stage run inside it.
+
+    Parameters
+    ----------
+    track_cardinality : bool, optional
+        If True, record the number of distinct input values of each stage. Defaults to True.
+    track_memory : bool, optional
+        If True, record the peak memory of each stage. Defaults to False.
+
+    Example
+    -------
+    with profile(track_memory=True) as profiler:
+        SanitiseData.sanitise_data(df, columns, rules)
+    print(profiler.to_prometheus())
+    """
+
+    def __init__(self, track_cardinality: bool = True, track_memory: bool = False):
+        self.track_cardinality = track_cardinality
+        self.track_memory = track_memory
+        self.records: List[StageMetrics] = []
+
+    def _record(self, metrics: StageMetrics) -> None:
+        self.records.append(metrics)
+
+    def __enter__(self) -> 'profile':
+        add_listener(self._record, self.track_cardinality, self.track_memory)
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        remove_listener(self._record)
+
+    def summary(self) -> Dict[tuple, Dict[str, float]]:
+        """
+        Aggregate the records per stage and column.
+
+        Returns
+        -------
+        Dict[tuple, Dict[str, float]]
+            A mapping from (stage, column) to the number of calls, total seconds,
+            total rows and the largest peak memory delta seen.
+        """
+        summary = {}
+        for record in self.records:
+            totals = summary.setdefault(
+                (record.stage, record.column),
+                {'calls': 0, 'seconds': 0.0, 'rows': 0, 'peak_memory_bytes': None}
+            )
+            totals['calls'] += 1
+            totals['seconds'] += record.wall_time
+            totals['rows'] += record.n_rows
+            if record.peak_memory_delta is not None:
+                totals['peak_memory_bytes'] = max(totals['peak_memory_bytes'] or 0, record.peak_memory_delta)
+        return summary
+
+    def to_json_lines(self) -> str:
+        """
+        Export the records as newline-delimited JSON, one object per stage run.
+        """
+        return '\n'.join(json.dumps(asdict(record)) for record in self.records)
+
+    def to_prometheus(self, prefix: str = 'cdpg_anonkit') -> str:
+        """
+        Export the aggregated records in the Prometheus text exposition format.
+
+        Parameters
+        ----------
+        prefix : str, optional
+            The prefix of the metric names. Defaults to 'cdpg_anonkit'.
+
+        Returns
+        -------
+        str
+            Counters for calls, seconds and rows, and a gauge for peak memory,
+            labelled by stage and column. Label values are escaped as the format requires.
+        """
+        metrics = [
+            ('stage_calls_total', 'counter', 'Number of runs of the stage.', 'calls'),
+            ('stage_seconds_total', 'counter', 'Wall time spent in the stage.', 'seconds'),
+            ('stage_rows_total', 'counter', 'Rows processed by the stage.', 'rows'),
+            ('stage_peak_memory_bytes', 'gauge', 'Largest peak memory delta of the stage.', 'peak_memory_bytes'),
+        ]
+        summary = self.summary()
+        lines = []
+        for metric, metric_type, description, key in metrics:
+            lines.append(f'# HELP {prefix}_{metric} {description}')
+            lines.append(f'# TYPE {prefix}_{metric} {metric_type}')
+            for (stage_name, column), totals in summary.items():
+                if totals[key] is None:
+                    continue
+                labels = f'stage="{_escape_label(stage_name)}"'
+                if column is not None:
+                    labels += f',column="{_escape_label(column)}"'
+                lines.append(f'{prefix}_{metric}{{{labels}}} {totals[key]}')
+        return '\n'.join(lines) + '\n'
@@ -0,0 +1,180 @@
+from typing import List, Union, Dict, Optional, Tuple
+from concurrent.futures import ProcessPoolExecutor
+import os
+import pandas as pd
+import numpy as np
+
+from .sanitisation import SanitiseData
+from .generalisation import GeneraliseData, CategoricalBinner
+
+# sanitisation methods whose output depends on the whole column rather than a single row
+GLOBAL_METHODS = ('suppress',)
+
+
+def generalise_frame(df: pd.DataFrame, generalisation_rules: Dict[str, Dict[str, Union[str, float, int, List, Dict]]]) -> pd.DataFrame:
+    """
+    Apply row-local generalisation rules to a DataFrame in place.
+
+    Parameters
+    ----------
+    df : pd.DataFrame
+        The DataFrame whose columns are to be generalised. It is modified in place.
+    generalisation_rules : Dict[str, Dict[str, Union[str, float, int, List, Dict]]]
+        A dictionary mapping a column name to a dictionary with the keys:
+        * 'method': str, one of 'spatial', 'temporal' or 'categorical'
+        * 'params': Dict, the parameters for the generaliser
+        'spatial' expects a column of "[lat, lon]" strings and takes 'spatial_resolution',
+        'temporal' takes 'temporal_resolution' and 'categorical' takes 'bins' and 'labels',
+        where 'bins' is a list of edges or a fitted CategoricalBinner.
+
+    Returns
+    -------
+    pd.DataFrame
+        The generalised DataFrame.
+
+    Raises
+    ------
+    ValueError
+        If a column is missing, a method is unknown, or categorical bins are given as an integer.
+    """
+    for column, rule in generalisation_rules.items():
+        if column not in df.columns:
+            raise ValueError(f"Column '{column}' not found in DataFrame")
+
+        method = rule['method']
+        params = rule.get('params', {})
+
+        if method == 'spatial':
+            latitude, longitude = GeneraliseData.SpatialGeneraliser.format_coordinates(df[column])
+            # generalise_spatial returns a fresh RangeIndex, so assign positionally
+            df[column] = GeneraliseData.SpatialGeneraliser.generalise_spatial(
+                latitude, longitude, params['spatial_resolution']
+            ).to_numpy()
+        elif method == 'temporal':
+            df[column] = GeneraliseData.TemporalGeneraliser.generalise_temporal(
+                df[column], temporal_resolution=params.get('temporal_resolution', 60)
+            ).to_numpy()
+        elif method == 'categorical':
+            # integer bins derive their edges from the min and max of the data they see,
+            # which differs between partitions
+            if not isinstance(params['bins'], CategoricalBinner) and np.ndim(params['bins']) == 0:
+                raise ValueError(
+                    f"Categorical generalisation of column '{column}' needs explicit bin edges "
+                    "or a fitted CategoricalBinner when the data is processed in partitions"
+                )
+            df[column] = GeneraliseData.CategoricalGeneraliser.generalise_categorical(
+                df[column], params['bins'], params.get('labels')
+            )
+        else:
+            raise ValueError(f"Unknown generalisation method '{method}' for column '{column}'")
+
+    return df
+
+
+def _run_partition(
+    partition: pd.DataFrame,
+    generalisation_rules: Dict[str, Dict],
+    row_columns: List[str],
+    global_columns: List[str],
+    sanitisation_rules: Dict[str, Dict]
+) -> Tuple[pd.DataFrame, Dict[str, pd.Series]]:
+    # map phase: everything that only needs the rows of this partition
+    partition = generalise_frame(partition.copy(), generalisation_rules)
+    if row_columns:
+        partition = SanitiseData.sanitise_data(partition, row_columns, sanitisation_rules)
+    counts = {column: partition[column].value_counts() for column in global_columns}
+    return partition, counts
+
+
+class PartitionedExecutor:
+    """
+    Run the generalise and sanitise pipeline over row partitions on a process pool.
+
+    Row-local steps (generalisation, clipping and hashing) run independently on each
+    partition. Steps that need global state, such as the value counts behind suppression,
+    are computed per partition and merged in a reduce phase before being applied.
+
+    Parameters
+    ----------
+    n_workers : int, optional
+        The number of worker processes. Defaults to the number of CPUs.
+        With a single worker the pipeline runs in the calling process.
+    n_partitions : int, optional
+        The number of row partitions. Defaults to n_workers.
+    """
+
+    def __init__(self, n_workers: Optional[int] = None, n_partitions: Optional[int] = None):
+        self.n_workers = n_workers or os.cpu_count() or 1
+        self.n_partitions = n_partitions or self.n_workers
+        if self.n_workers < 1 or self.n_partitions < 1:
+            raise ValueError("n_workers and n_partitions must be positive")
+
+    def run(
+        self,
+        df: pd.DataFrame,
+        columns_to_sanitise: List[str],
+        sanitisation_rules: Dict[str, Dict[str, Union[str, float, int, List, Dict]]],
+        generalisation_rules: Optional[Dict[str, Dict[str, Union[str, float, int, List, Dict]]]] = None,
+        drop_na: bool = False
+    ) -> pd.DataFrame:
+        """
+        Generalise and sanitise a DataFrame partition by partition.
+
+        The result is the same as applying `generalise_frame` followed by
+        `SanitiseData.sanitise_data` to the whole DataFrame.
+
+        Parameters
+        ----------
+        df : pd.DataFrame
+            The input DataFrame.
+        columns_to_sanitise : List[str]
+            The columns in the DataFrame to be sanitised.
+        sanitisation_rules : Dict[str, Dict[str, Union[str, float, int, List, Dict]]]
+            The sanitisation rules, in the format accepted by `SanitiseData.sanitise_data`.
+        generalisation_rules : Optional[Dict[str, Dict[str, Union[str, float, int, List, Dict]]]], optional
+            The generalisation rules, in the format accepted by `generalise_frame`.
+            Defaults to None, which means no generalisation is applied.
+        drop_na : bool, optional
+            If True, drop all rows that have NaN values in the sanitised columns. Defaults to False.
+
+        Returns
+        -------
+        pd.DataFrame
+            The generalised and sanitised DataFrame, in the original row order.
+        """
+        generalisation_rules = generalisation_rules or {}
+
+        for column in columns_to_sanitise:
+            if column not in df.columns:
+                raise ValueError(f"Column '{column}' not found in DataFrame")
+            if not sanitisation_rules.get(column):
+                raise ValueError(f"No sanitisation rule specified for column '{column}'")
+
+        global_columns = [c for c in columns_to_sanitise if sanitisation_rules[c]['method'] in GLOBAL_METHODS]
+        row_columns = [c for c in columns_to_sanitise if c not in global_columns]
+
+        n_partitions = max(1, min(self.n_partitions, len(df)))
+        bounds = np.linspace(0, len(df), n_partitions + 1).astype(int)
+        partitions = [df.iloc[start:stop] for start, stop in zip(bounds[:-1], bounds[1:])]
+        args = (generalisation_rules, row_columns, global_columns, sanitisation_rules)
+
+        if self.n_workers == 1 or n_partitions == 1:
+            results = [_run_partition(partition, *args) for partition in partitions]
+        else:
+            with ProcessPoolExecutor(max_workers=min(self.n_workers, n_partitions)) as pool:
+                futures = [pool.submit(_run_partition, partition, *args) for partition in partitions]
+                results = [future.result() for future in futures]
+
+        df_sanitised = pd.concat([partition for partition, _ in results])
+
+        # reduce phase: merge the per-partition counts and apply the global steps
+        for column in global_columns:
+            params = sanitisation_rules[column].get('params', {})
+            value_counts = pd.concat([counts[column] for _, counts in results]).groupby(level=0).sum()
+            values_to_suppress = value_counts[value_counts < params.get('threshold', 5)].index
+            df_sanitised[column] = df_sanitised[column].replace(values_to_suppress, params.get('replacement'))
+
+        if drop_na:
+            df_sanitised = df_sanitised.dropna(subset=columns_to_sanitise)
+
+        return df_sanitised
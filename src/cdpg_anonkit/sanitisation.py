@@ -3,6 +3,8 @@ import pandas as pd
 import numpy as np
 import hashlib
 
+from .instrumentation import stage
+
 class SanitiseData:
     def clip(series: pd.Series, min_value: float, max_value: float) -> pd.Series:
         """
@@ -101,6 +103,8 @@ class SanitiseData:
             * 'method': str, the sanitisation method to use
             * 'params': Dict[str, Union[str, float, int, List, Dict]], the parameters
               for the sanitisation method
+            The 'tokenise' method replaces values with int64 tokens and takes a
+            TokenVault as its 'vault' parameter.
         drop_na : bool, optional
             If True, drop all rows in the DataFrame that have any NaN values in the
             columns specified in columns_to_sanitise. Defaults to False.
@@ -123,14 +127,17 @@ class SanitiseData:
             method = rule['method']
             params = rule.get('params', {})
 
-            if method == 'clip':
-                df_sanitised[column] = SanitiseData.clip(df_sanitised[column], params['min_value'], params['max_value'])
-            elif method == 'hash':
-                df_sanitised[column] = SanitiseData.hash_values(df_sanitised[column], params.get('salt', ''))
-            elif method == 'suppress':
-                df_sanitised[column] = SanitiseData.suppress(df_sanitised[column], params.get('threshold', 5), params.get('replacement'))
-            else:
-                raise ValueError(f"Unknown sanitisation method '{method}' for column '{column}'")
+            with stage(f'sanitise_data.{method}', df_sanitised[column], column=column):
+                if method == 'clip':
+                    df_sanitised[column] = SanitiseData.clip(df_sanitised[column], params['min_value'], params['max_value'])
+                elif method == 'hash':
+                    df_sanitised[column] = SanitiseData.hash_values(df_sanitised[column], params.get('salt', ''))
+                elif method == 'suppress':
+                    df_sanitised[column] = SanitiseData.suppress(df_sanitised[column], params.get('threshold', 5), params.get('replacement'))
+                elif method == 'tokenise':
+                    df_sanitised[column] = params['vault'].tokenise(df_sanitised[column])
+                else:
+                    raise ValueError(f"Unknown sanitisation method '{method}' for column '{column}'")
 
         if drop_na:
             df_sanitised = df_sanitised.dropna(subset=columns_to_sanitise)
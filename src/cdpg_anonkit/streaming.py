@@ -0,0 +1,233 @@
+from typing import Any, AsyncIterable, AsyncIterator, Counter, Dict, List, Optional, Union
+from concurrent.futures import Executor
+import asyncio
+import collections
+import pandas as pd
+
+from .parallel import GLOBAL_METHODS, _run_partition
+
+# marks the end of a stream in the internal queues
+_END = object()
+
+
+class _Failure:
+    def __init__(self, error: BaseException):
+        self.error = error
+
+
+class InProcessSource:
+    """
+    An in-process message source backed by a bounded asyncio queue.
+
+    Producers `await put(message)` and finally `await close()`; the source is then
+    iterated with `async for`. When the queue is full, `put` waits, which passes
+    backpressure from the anonymiser on to the producer.
+
+    Parameters
+    ----------
+    maxsize : int, optional
+        The maximum number of messages held in the queue. Defaults to 0, which means unbounded.
+    """
+
+    def __init__(self, maxsize: int = 0):
+        self._queue = asyncio.Queue(maxsize)
+
+    async def put(self, message: Dict[str, Any]) -> None:
+        await self._queue.put(message)
+
+    async def close(self) -> None:
+        await self._queue.put(_END)
+
+    def __aiter__(self) -> 'InProcessSource':
+        return self
+
+    async def __anext__(self) -> Dict[str, Any]:
+        message = await self._queue.get()
+        if message is _END:
+            raise StopAsyncIteration
+        return message
+
+
+class MicroBatchAnonymiser:
+    """
+    Anonymise a continuous stream of messages in size- or time-bounded micro-batches.
+
+    Messages (dictionaries mapping column names to values) are collected into a batch
+    until either `max_batch_size` messages have arrived or `max_latency` seconds have
+    passed since the first message of the batch. Each batch is generalised and sanitised
+    on an executor, so the event loop keeps receiving messages while pandas works.
+
+    All queues between the source, the batcher, the executor and the consumer are bounded.
+    A slow consumer therefore stops the anonymiser from reading further messages rather
+    than letting them pile up in memory.
+
+    Suppression is stateful across batches: the value counts of each suppressed column
+    are accumulated over the whole stream, and a value is replaced while its running
+    count is below the threshold. The counts are kept on the instance, so they carry over
+    between calls to `stream`. Each batch only touches the counts of its own values, so the
+    cost of a batch does not grow with the number of distinct values seen so far.
+
+    Parameters
+    ----------
+    columns_to_sanitise : List[str]
+        The columns to be sanitised.
+    sanitisation_rules : Dict[str, Dict[str, Union[str, float, int, List, Dict]]]
+        The sanitisation rules, in the format accepted by `SanitiseData.sanitise_data`.
+    generalisation_rules : Optional[Dict[str, Dict[str, Union[str, float, int, List, Dict]]]], optional
+        The generalisation rules, in the format accepted by `generalise_frame`. Defaults to None.
+    max_batch_size : int, optional
+        The maximum number of messages in a batch. Defaults to 1000.
+    max_latency : float, optional
+        The maximum number of seconds a message waits for its batch to fill. Defaults to 0.5.
+    max_pending_batches : int, optional
+        The number of batches that may wait for processing, and the number of results that may
+        wait for the consumer, before the anonymiser stops reading. Defaults to 4.
+    executor : Optional[Executor], optional
+        The executor that runs the pandas work. Defaults to None, which uses the event loop's
+        default thread pool.
+    drop_na : bool, optional
+        If True, drop rows with NaN values in the sanitised columns. Defaults to False.
+
+    Example
+    -------
+    anonymiser = MicroBatchAnonymiser(['name'], {'name': {'method': 'hash'}})
+    async for batch in anonymiser.stream(source):
+        publish(batch)
+    """
+
+    def __init__(
+        self,
+        columns_to_sanitise: List[str],
+        sanitisation_rules: Dict[str, Dict[str, Union[str, float, int, List, Dict]]],
+        generalisation_rules: Optional[Dict[str, Dict[str, Union[str, float, int, List, Dict]]]] = None,
+        max_batch_size: int = 1000,
+        max_latency: float = 0.5,
+        max_pending_batches: int = 4,
+        executor: Optional[Executor] = None,
+        drop_na: bool = False
+    ):
+        for column in columns_to_sanitise:
+            if not sanitisation_rules.get(column):
+                raise ValueError(f"No sanitisation rule specified for column '{column}'")
+        if max_batch_size < 1 or max_pending_batches < 1:
+            raise ValueError("max_batch_size and max_pending_batches must be positive")
+
+        self.columns_to_sanitise = columns_to_sanitise
+        self.sanitisation_rules = sanitisation_rules
+        self.generalisation_rules = generalisation_rules or {}
+        self.max_batch_size = max_batch_size
+        self.max_latency = max_latency
+        self.max_pending_batches = max_pending_batches
+        self.executor = executor
+        self.drop_na = drop_na
+
+        self.global_columns = [c for c in columns_to_sanitise if sanitisation_rules[c]['method'] in GLOBAL_METHODS]
+        self.row_columns = [c for c in columns_to_sanitise if c not in self.global_columns]
+        # running value counts of each suppressed column over everything seen so far
+        self.counts: Dict[str, Counter] = {column: collections.Counter() for column in self.global_columns}
+
+    async def stream(self, source: AsyncIterable[Dict[str, Any]]) -> AsyncIterator[pd.DataFrame]:
+        """
+        Anonymise the messages of a source and yield the results batch by batch.
+
+        Parameters
+        ----------
+        source : AsyncIterable[Dict[str, Any]]
+            An asynchronous iterable of messages, e.g. an InProcessSource.
+
+        Yields
+        ------
+        pd.DataFrame
+            The anonymised rows of each micro-batch, in arrival order.
+
+        Raises
+        ------
+        Exception
+            Any error raised by the source or by the pipeline is re-raised here, after
+            the background tasks have been cancelled.
+        """
+        loop = asyncio.get_running_loop()
+        intake = asyncio.Queue(self.max_batch_size)
+        batches = asyncio.Queue(self.max_pending_batches)
+        results = asyncio.Queue(self.max_pending_batches)
+
+        async def guarded(stage):
+            try:
+                await stage()
+            except asyncio.CancelledError:
+                raise
+            except Exception as error:
+                await results.put(_Failure(error))
+
+        async def read():
+            async for message in source:
+                await intake.put(message)
+            await intake.put(_END)
+
+        async def collect():
+            finished = False
+            while not finished:
+                message = await intake.get()
+                if message is _END:
+                    break
+                batch = [message]
+                deadline = loop.time() + self.max_latency
+                while len(batch) < self.max_batch_size:
+                    timeout = deadline - loop.time()
+                    if timeout <= 0:
+                        break
+                    try:
+                        message = await asyncio.wait_for(intake.get(), timeout)
+                    except asyncio.TimeoutError:
+                        break
+                    if message is _END:
+                        finished = True
+                        break
+                    batch.append(message)
+                await batches.put(batch)
+            await batches.put(_END)
+
+        async def process():
+            while True:
+                batch = await batches.get()
+                if batch is _END:
+                    break
+                frame = pd.DataFrame.from_records(batch)
+                partition, counts = await loop.run_in_executor(
+                    self.executor, _run_partition, frame, self.generalisation_rules,
+                    self.row_columns, self.global_columns, self.sanitisation_rules
+                )
+                # the running counts live in this process, so they are updated on the default
+                # thread pool rather than on `executor`, which may be a process pool; batches
+                # are processed one at a time, so the updates never overlap
+                partition = await loop.run_in_executor(None, self._apply_state, partition, counts)
+                await results.put(partition)
+            await results.put(_END)
+
+        tasks = [asyncio.create_task(guarded(stage)) for stage in (read, collect, process)]
+        try:
+            while True:
+                result = await results.get()
+                if result is _END:
+                    break
+                if isinstance(result, _Failure):
+                    raise result.error
+                yield result
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    def _apply_state(self, partition: pd.DataFrame, counts: Dict[str, pd.Series]) -> pd.DataFrame:
+        for column in self.global_columns:
+            params = self.sanitisation_rules[column].get('params', {})
+            running = self.counts[column]
+            batch_counts = counts[column].to_dict()
+            running.update(batch_counts)
+            threshold = params.get('threshold', 5)
+            values_to_suppress = [value for value in batch_counts if running[value] < threshold]
+            partition[column] = partition[column].mask(partition[column].isin(values_to_suppress), params.get('replacement'))
+
+        if self.drop_na:
+            partition = partition.dropna(subset=self.columns_to_sanitise)
+        return partition
@@ -0,0 +1,240 @@
+from typing import Dict, List, Tuple, Union
+import warnings
+import pandas as pd
+import numpy as np
+from pandas.tseries.api import guess_datetime_format
+
+# reason codes recorded in the quarantine frame
+MISSING = 'missing'
+INVALID_COORDINATE = 'invalid_coordinate'
+LATITUDE_OUT_OF_RANGE = 'latitude_out_of_range'
+LONGITUDE_OUT_OF_RANGE = 'longitude_out_of_range'
+INVALID_TIMESTAMP = 'invalid_timestamp'
+INVALID_NUMBER = 'invalid_number'
+OUT_OF_RANGE = 'out_of_range'
+
+# accepts only "[lat, lon]" strings that format_coordinates parses: it strips brackets
+# before spaces, so no whitespace is allowed outside the brackets
+_NUMBER = r'\s*([+-]?(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?)\s*'
+_COORDINATE_PATTERN = rf'^[\[\]]*{_NUMBER},{_NUMBER}[\[\]]*$'
+
+# the number of leading non-null timestamps the format is inferred from
+_FORMAT_GUESS_ROWS = 20
+
+
+class ValidateData:
+
+    @staticmethod
+    def parse_coordinates(series: pd.Series) -> Tuple[pd.Series, pd.Series, pd.Series]:
+        """
+        Parse "[lat, lon]" coordinate strings in a single vectorised pass.
+
+        Unlike format_coordinates, malformed values do not raise; they are marked in the
+        returned reason Series instead.
+
+        Parameters
+        ----------
+        series : pd.Series
+            The series of coordinates to be parsed.
+
+        Returns
+        -------
+        Tuple[pd.Series, pd.Series, pd.Series]
+            The latitude and longitude as floats (NaN where they cannot be parsed), and a Series of
+            reason codes that is None for valid rows. Latitudes outside -90 to 90 and
+            longitudes outside -180 to 180 are reported as out of range.
+        """
+        # on object columns the str accessor leaves non-string values as NaN, as they cannot be parsed
+        text = series if series.dtype == object else series.astype('string')
+        parts = text.str.extract(_COORDINATE_PATTERN)
+        latitude = pd.to_numeric(parts[0], errors='coerce').astype(np.float64)
+        longitude = pd.to_numeric(parts[1], errors='coerce').astype(np.float64)
+
+        reason = np.select(
+            [
+                series.isna().to_numpy(),
+                (latitude.isna() | longitude.isna()).to_numpy(),
+                ~latitude.between(-90, 90).to_numpy(),
+                ~longitude.between(-180, 180).to_numpy(),
+            ],
+            [MISSING, INVALID_COORDINATE, LATITUDE_OUT_OF_RANGE, LONGITUDE_OUT_OF_RANGE],
+            default=None
+        )
+        return (
+            latitude.rename(series.name),
+            longitude.rename(series.name),
+            pd.Series(reason, index=series.index, dtype=object),
+        )
+
+    @staticmethod
+    def coordinates_reason(series: pd.Series) -> pd.Series:
+        """Reason codes for a column of "[lat, lon]" strings, None where the value is valid."""
+        return ValidateData.parse_coordinates(series)[2]
+
+    @staticmethod
+    def latitude_reason(series: pd.Series) -> pd.Series:
+        """Reason codes for a numeric latitude column, None where the value is valid."""
+        return ValidateData.range_reason(series, -90, 90, LATITUDE_OUT_OF_RANGE)
+
+    @staticmethod
+    def longitude_reason(series: pd.Series) -> pd.Series:
+        """Reason codes for a numeric longitude column, None where the value is valid."""
+        return ValidateData.range_reason(series, -180, 180, LONGITUDE_OUT_OF_RANGE)
+
+    @staticmethod
+    def range_reason(series: pd.Series, min_value: float = -np.inf, max_value: float = np.inf, code: str = OUT_OF_RANGE) -> pd.Series:
+        """
+        Reason codes for a numeric column that must lie within [min_value, max_value].
+
+        Returns
+        -------
+        pd.Series
+            'missing' for null values, 'invalid_number' for values that are not numeric,
+            `code` for values outside the range, and None for valid values.
+        """
+        values = pd.to_numeric(series, errors='coerce')
+        reason = np.select(
+            [series.isna().to_numpy(), values.isna().to_numpy(), ~values.between(min_value, max_value).to_numpy()],
+            [MISSING, INVALID_NUMBER, code],
+            default=None
+        )
+        return pd.Series(reason, index=series.index, dtype=object)
+
+    @staticmethod
+    def parse_timestamps(series: pd.Series) -> pd.Series:
+        """
+        Parse a timestamp column the way generalise_temporal does, without raising.
+
+        generalise_temporal calls pd.to_datetime without a format, which infers the format
+        from the first value and fails on any value that does not follow it. The same format
+        is inferred here, from the first of the leading non-null strings it can be inferred
+        from, and values that do not follow it become NaT, so the rows that remain are parsed
+        consistently whichever of them comes first.
+
+        If no format can be inferred from the first 20 non-null values, pandas parses every
+        value separately with dateutil, which is orders of magnitude slower on large columns;
+        a UserWarning is issued in that case.
+
+        Parameters
+        ----------
+        series : pd.Series
+            The series of timestamps to be parsed.
+
+        Returns
+        -------
+        pd.Series
+            The parsed timestamps, NaT where a value is missing or does not parse.
+        """
+        if pd.api.types.is_datetime64_any_dtype(series):
+            return series
+        # only a few leading values are tried, so junk or unusual formats never cost a full scan
+        candidates = [value for value in series.dropna().head(_FORMAT_GUESS_ROWS) if isinstance(value, str)]
+        timestamp_format = next(
+            (guessed for guessed in map(guess_datetime_format, candidates) if guessed is not None),
+            None
+        )
+        if timestamp_format is None and candidates:
+            column = f" '{series.name}'" if series.name is not None else ''
+            warnings.warn(
+                f"Could not infer a timestamp format for column{column}; "
+                "falling back to slow per-row parsing",
+                UserWarning,
+                stacklevel=2
+            )
+        with warnings.catch_warnings():
+            # without a format pandas warns that it falls back to dateutil for each value
+            warnings.simplefilter('ignore', UserWarning)
+            return pd.to_datetime(series, format=timestamp_format, errors='coerce')
+
+    @staticmethod
+    def timestamp_reason(series: pd.Series) -> pd.Series:
+        """
+        Reason codes for a timestamp column, None where the value parses.
+
+        Values are accepted only if they follow the format generalise_temporal will infer
+        for the clean rows; see parse_timestamps.
+        """
+        parsed = ValidateData.parse_timestamps(series)
+        reason = np.select(
+            [series.isna().to_numpy(), parsed.isna().to_numpy()],
+            [MISSING, INVALID_TIMESTAMP],
+            default=None
+        )
+        return pd.Series(reason, index=series.index, dtype=object)
+
+    @staticmethod
+    def not_null_reason(series: pd.Series) -> pd.Series:
+        """Reason codes that flag null values as missing."""
+        return pd.Series(np.where(series.isna().to_numpy(), MISSING, None), index=series.index, dtype=object)
+
+    @staticmethod
+    def quarantine(
+        df: pd.DataFrame,
+        validation_rules: Dict[str, Dict[str, Union[str, float, int, List, Dict]]]
+    ) -> Tuple[pd.DataFrame, pd.DataFrame]:
+        """
+        Split a DataFrame into valid rows and quarantined invalid rows.
+
+        Every rule is evaluated on its whole column at once, so a malformed value never
+        aborts the job. Rows that fail any rule are moved to the quarantine frame, together
+        with the first failing column and its reason code.
+
+        Parameters
+        ----------
+        df : pd.DataFrame
+            The input DataFrame.
+        validation_rules : Dict[str, Dict[str, Union[str, float, int, List, Dict]]]
+            A dictionary that maps a column to a dictionary with the keys:
+            * 'check': str, one of 'coordinates', 'latitude', 'longitude', 'timestamp',
+              'range' or 'not_null'
+            * 'params': Dict, the parameters for the check ('min_value' and 'max_value' for 'range')
+
+        Returns
+        -------
+        Tuple[pd.DataFrame, pd.DataFrame]
+            The valid rows, and the invalid rows with two extra columns:
+            'quarantine_column' and 'quarantine_reason'.
+
+        Raises
+        ------
+        ValueError
+            If a column is not found in the DataFrame or a check is unknown.
+
+        Example
+        -------
+        clean, rejected = ValidateData.quarantine(df, {
+            'location': {'check': 'coordinates'},
+            'timestamp': {'check': 'timestamp'},
+            'age': {'check': 'range', 'params': {'min_value': 0, 'max_value': 120}}
+        })
+        """
+        checks = {
+            'coordinates': ValidateData.coordinates_reason,
+            'latitude': ValidateData.latitude_reason,
+            'longitude': ValidateData.longitude_reason,
+            'timestamp': ValidateData.timestamp_reason,
+            'range': ValidateData.range_reason,
+            'not_null': ValidateData.not_null_reason,
+        }
+
+        failed_column = np.full(len(df), None, dtype=object)
+        failed_reason = np.full(len(df), None, dtype=object)
+
+        for column, rule in validation_rules.items():
+            if column not in df.columns:
+                raise ValueError(f"Column '{column}' not found in DataFrame")
+            check = rule['check']
+            if check not in checks:
+                raise ValueError(f"Unknown validation check '{check}' for column '{column}'")
+
+            reason = checks[check](df[column], **rule.get('params', {})).to_numpy()
+            # keep the first failure recorded for each row
+            newly_failed = pd.notna(reason) & pd.isna(failed_reason)
+            failed_column[newly_failed] = column
+            failed_reason[newly_failed] = reason[newly_failed]
+
+        invalid = pd.notna(failed_reason)
+        rejected = df[invalid].copy()
+        rejected['quarantine_column'] = failed_column[invalid]
+        rejected['quarantine_reason'] = failed_reason[invalid]
+        return df[~invalid], rejected
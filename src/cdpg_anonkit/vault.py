@@ -0,0 +1,176 @@
+from typing import Dict, List, Union
+from collections import OrderedDict
+import hashlib
+import hmac
+import sqlite3
+import threading
+import pandas as pd
+import numpy as np
+
+# SQLite limits the number of bound parameters per statement
+_QUERY_CHUNK = 900
+
+
+class TokenVault:
+    """
+    A persistent vault that maps values to short, stable int64 surrogate tokens.
+
+    Each value is keyed-hashed with HMAC-SHA256, and the digest is stored in an SQLite
+    table whose row id is the token. The same value and key therefore get the same token
+    in every run that uses the same vault file, and the raw value is never stored.
+    Recently used values are served from an in-memory LRU cache without hashing.
+
+    The database uses write-ahead logging and memory-mapped reads, so any number of
+    processes can read the vault while one of them writes to it.
+
+    Parameters
+    ----------
+    path : str
+        The path of the SQLite file. Use ':memory:' for a vault that lives only as long as the object.
+    key : Union[str, bytes]
+        The secret key for the keyed hash. Tokens are only stable for the same key.
+    cache_size : int, optional
+        The maximum number of values held in the LRU cache. Defaults to 100,000.
+    read_only : bool, optional
+        If True, values that are not yet in the vault are tokenised as missing instead of
+        being inserted. Defaults to False.
+    timeout : float, optional
+        Seconds to wait for another writer to release the database. Defaults to 30.
+
+    Example
+    -------
+    with TokenVault('tokens.db', key='my_secret_key') as vault:
+        df['user_token'] = vault.tokenise(df['user_id'])
+    """
+
+    def __init__(
+        self,
+        path: str,
+        key: Union[str, bytes],
+        cache_size: int = 100_000,
+        read_only: bool = False,
+        timeout: float = 30.0
+    ):
+        self.path = path
+        self.key = key.encode('utf-8') if isinstance(key, str) else key
+        self.cache_size = cache_size
+        self.read_only = read_only
+        self.timeout = timeout
+        self._cache: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+        self._connect()
+
+    def _connect(self) -> None:
+        if self.read_only:
+            self._connection = sqlite3.connect(
+                f'file:{self.path}?mode=ro', uri=True, timeout=self.timeout, check_same_thread=False, isolation_level=None
+            )
+        else:
+            self._connection = sqlite3.connect(self.path, timeout=self.timeout, check_same_thread=False, isolation_level=None)
+            self._connection.execute(
+                'CREATE TABLE IF NOT EXISTS tokens (token INTEGER PRIMARY KEY AUTOINCREMENT, digest BLOB NOT NULL UNIQUE)'
+            )
+            if self.path != ':memory:':
+                self._connection.execute('PRAGMA journal_mode=WAL')
+        self._connection.execute('PRAGMA mmap_size=268435456')
+
+    # the connection cannot be pickled, so workers reopen the vault from its path
+    def __getstate__(self) -> Dict:
+        if self.path == ':memory:':
+            raise TypeError("An in-memory TokenVault cannot be shared with other processes")
+        return {'path': self.path, 'key': self.key, 'cache_size': self.cache_size,
+                'read_only': self.read_only, 'timeout': self.timeout}
+
+    def __setstate__(self, state: Dict) -> None:
+        self.__init__(**state)
+
+    def __enter__(self) -> 'TokenVault':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._connection.execute('SELECT COUNT(*) FROM tokens').fetchone()[0]
+
+    def close(self) -> None:
+        self._connection.close()
+
+    def digest(self, value) -> bytes:
+        """
+        The keyed hash of a value, computed on its string form as in SanitiseData.hash_values.
+        """
+        return hmac.new(self.key, str(value).encode('utf-8'), hashlib.sha256).digest()
+
+    def tokenise(self, series: pd.Series) -> pd.Series:
+        """
+        Replace each value in a Series with its token.
+
+        Parameters
+        ----------
+        series : pd.Series
+            The values to tokenise.
+
+        Returns
+        -------
+        pd.Series
+            A nullable Int64 Series with the same index and name as `series`. Null
+            values stay null, as do unknown values when the vault is read-only.
+        """
+        codes, uniques = pd.factorize(series)
+        keys = [str(value) for value in uniques]
+        # one extra slot that stays 0, which null values (code -1) index into
+        tokens = np.zeros(len(keys) + 1, dtype=np.int64)
+
+        with self._lock:
+            missing: List[int] = []
+            for i, key in enumerate(keys):
+                token = self._cache.get(key)
+                if token is None:
+                    missing.append(i)
+                else:
+                    self._cache.move_to_end(key)
+                    tokens[i] = token
+
+            if missing:
+                digests = [self.digest(keys[i]) for i in missing]
+                found = self._lookup(digests)
+                new = list({d for d in digests if d not in found})
+                if new and not self.read_only:
+                    self._connection.execute('BEGIN IMMEDIATE')
+                    try:
+                        self._connection.executemany(
+                            'INSERT OR IGNORE INTO tokens (digest) VALUES (?)', [(d,) for d in new]
+                        )
+                        self._connection.execute('COMMIT')
+                    except BaseException:
+                        self._connection.execute('ROLLBACK')
+                        raise
+                    found.update(self._lookup(new))
+                for i, digest in zip(missing, digests):
+                    token = found.get(digest, 0)
+                    tokens[i] = token
+                    if token:
+                        self._remember(keys[i], token)
+
+        # tokens start at 1, so 0 marks a null value or one the read-only vault does not know
+        values = tokens[codes]
+        result = pd.array(values, dtype='Int64')
+        result[values == 0] = pd.NA
+        return pd.Series(result, index=series.index, name=series.name)
+
+    def _lookup(self, digests: List[bytes]) -> Dict[bytes, int]:
+        found = {}
+        for start in range(0, len(digests), _QUERY_CHUNK):
+            chunk = digests[start:start + _QUERY_CHUNK]
+            placeholders = ','.join('?' * len(chunk))
+            found.update(self._connection.execute(
+                f'SELECT digest, token FROM tokens WHERE digest IN ({placeholders})', chunk
+            ).fetchall())
+        return found
+
+    def _remember(self, key: str, token: int) -> None:
+        self._cache[key] = token
+        if len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
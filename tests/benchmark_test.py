@@ -0,0 +1,58 @@
+import json
+import pytest
+import pandas as pd
+
+from src.cdpg_anonkit.generalisation import GeneraliseData
+from benchmarks import generators
+from benchmarks import run_benchmarks
+
+def test_coordinate_cloud_is_parseable():
+    """Generated location strings should round-trip through format_coordinates"""
+    df = generators.coordinate_cloud(500)
+    lat, lon = GeneraliseData.SpatialGeneraliser.format_coordinates(df['location'])
+
+    assert len(df) == 500
+    assert lat.tolist() == pytest.approx(df['latitude'].tolist())
+    assert lon.tolist() == pytest.approx(df['longitude'].tolist())
+
+def test_mixed_timestamps_are_parseable():
+    """Every generated timestamp should parse with format='mixed'"""
+    timestamps = generators.mixed_timestamps(500)
+    parsed = GeneraliseData.TemporalGeneraliser.format_timestamp(timestamps)
+
+    assert parsed.notna().all()
+    assert timestamps.str.contains('T').any() and timestamps.str.contains('/').any()
+
+def test_zipfian_ids_are_skewed():
+    """The most common id should be far more frequent than the median id"""
+    counts = generators.zipfian_ids(10_000, n_categories=1_000).value_counts()
+
+    assert counts.iloc[0] > 10 * counts.median()
+
+def test_generators_are_seeded():
+    """The same seed should produce the same frame"""
+    pd.testing.assert_frame_equal(generators.sample_frame(100, seed=1), generators.sample_frame(100, seed=1))
+
+def test_run_produces_machine_readable_report():
+    """The report should hold a record per benchmark and size and serialise to JSON"""
+    report = run_benchmarks.run([100, 200], ['hash_values', 'suppress'], repeat=1)
+
+    assert len(report['results']) == 4
+    assert set(report['scaling']) == {'hash_values', 'suppress'}
+    for record in report['results']:
+        assert record['rows_per_second'] > 0
+        assert record['peak_memory_bytes'] > 0
+    json.dumps(report)
+
+def test_compare_flags_regressions():
+    """Throughput drops beyond the tolerance should be reported"""
+    baseline = {'results': [{'benchmark': 'suppress', 'n_rows': 100, 'rows_per_second': 1000.0}]}
+    slower = {'results': [{'benchmark': 'suppress', 'n_rows': 100, 'rows_per_second': 500.0}]}
+    similar = {'results': [{'benchmark': 'suppress', 'n_rows': 100, 'rows_per_second': 900.0}]}
+
+    assert len(run_benchmarks.compare(slower, baseline, tolerance=0.25)) == 1
+    assert run_benchmarks.compare(similar, baseline, tolerance=0.25) == []
+
+def test_unknown_benchmark():
+    with pytest.raises(ValueError, match="Unknown benchmarks"):
+        run_benchmarks.run([100], ['invalid_benchmark'])
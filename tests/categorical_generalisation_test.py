@@ -1,7 +1,8 @@
 import pytest
 import pandas as pd
+import numpy as np
 
-from src.cdpg_anonkit.generalisation import GeneraliseData
+from src.cdpg_anonkit.generalisation import GeneraliseData, CategoricalBinner
 
 categorical_generaliser = GeneraliseData().CategoricalGeneraliser()
 
@@ -74,4 +75,106 @@ def test_categorical_generaliser_single_value():
     result = categorical_generaliser.generalise_categorical(data, bins=3)
     
     assert len(result) == 1
-    assert not result.iloc[0] is pd.NA
\ No newline at end of file
+    assert not result.iloc[0] is pd.NA
+# Test cases for CategoricalBinner
+def test_binner_consistent_across_chunks():
+    """Chunks binned with a frozen binner should share the same categories"""
+    rng = np.random.default_rng(0)
+    chunks = [pd.Series(rng.lognormal(10, 1, size=1000)) for _ in range(5)]
+    binner = CategoricalBinner(n_bins=4, labels=['q1', 'q2', 'q3', 'q4'])
+    for chunk in chunks:
+        binner.partial_fit(chunk)
+    binner.freeze()
+
+    results = [categorical_generaliser.generalise_categorical(chunk, bins=binner) for chunk in chunks]
+    assert all(list(result.cat.categories) == ['q1', 'q2', 'q3', 'q4'] for result in results)
+    merged = pd.concat(results)
+    assert isinstance(merged.dtype, pd.CategoricalDtype)
+    assert merged.notna().all()
+
+def test_binner_quantile_edges_are_equal_frequency():
+    """Quantile edges learned by the sketch should split the data into near-equal bins"""
+    rng = np.random.default_rng(1)
+    data = pd.Series(rng.exponential(size=100_000))
+    binner = CategoricalBinner(n_bins=10, sketch_size=512)
+    for chunk in np.array_split(data, 20):
+        binner.partial_fit(chunk)
+    binner.freeze()
+
+    counts = binner.transform(data).value_counts()
+    assert len(counts) == 10
+    assert counts.min() > 0.09 * len(data) and counts.max() < 0.11 * len(data)
+    assert binner.edges[0] == data.min() and binner.edges[-1] == data.max()
+
+def test_binner_uniform_matches_pd_cut():
+    """Equal-width bins should agree with pd.cut on the same range"""
+    data = pd.Series([1, 2, 3, 4, 5, 6, 7, 8, 9, 10])
+    binner = CategoricalBinner(n_bins=3, strategy='uniform')
+    binner.partial_fit(data[:5]).partial_fit(data[5:]).freeze()
+
+    result = binner.transform(data)
+    expected = pd.cut(data, bins=binner.edges, include_lowest=True)
+    assert (result.cat.codes == expected.cat.codes).all()
+    assert result.iloc[0] == result.iloc[1]
+    assert result.iloc[8] == result.iloc[9]
+
+def test_binner_from_edges():
+    """Fixed edges should bin like pd.cut with right-closed intervals"""
+    data = pd.Series([1, 5, 10, 15, 20, np.nan, 25], index=list('abcdefg'), name='value')
+    binner = CategoricalBinner.from_edges([0, 5, 10, 20], labels=['Low', 'Medium', 'High'])
+    codes = binner.encode(data)
+
+    assert codes.dtype == np.int8
+    assert list(codes) == [0, 0, 1, 2, 2, -1, -1]
+    result = binner.transform(data)
+    assert list(result.index) == list('abcdefg')
+    assert result.name == 'value'
+    assert result['a'] == 'Low' and result['c'] == 'Medium' and result['e'] == 'High'
+    assert pd.isna(result['g'])
+
+def test_binner_matches_pd_cut_with_same_edges():
+    """Swapping a list of edges for a binner should not change the values or the dtype"""
+    data = pd.Series([0.0, 5, 10, 25, 30, np.nan])
+    edges, labels = [0, 10, 20, 30], ['l', 'm', 'h']
+    expected = categorical_generaliser.generalise_categorical(data, edges, labels=labels)
+    result = categorical_generaliser.generalise_categorical(data, CategoricalBinner.from_edges(edges, labels=labels))
+
+    pd.testing.assert_series_equal(result, expected)
+    assert result.dtype.ordered
+    assert pd.isna(result.iloc[0])
+    assert result.max() == 'h'
+    assert isinstance(pd.concat([result, expected]).dtype, pd.CategoricalDtype)
+
+    included = CategoricalBinner.from_edges(edges, include_lowest=True).encode(data)
+    assert list(included[:2]) == [0, 0]
+
+def test_binner_open_ends():
+    """Values beyond the learned range should fall into the outer bins when open_ends is set"""
+    binner = CategoricalBinner.from_edges([0, 5, 10], open_ends=True)
+    assert list(binner.encode(pd.Series([-3, 12]))) == [0, 1]
+
+def test_binner_merge():
+    """Binners fitted on separate partitions should merge to the same range"""
+    left = CategoricalBinner(n_bins=2).partial_fit(pd.Series([1, 2, 3]))
+    right = CategoricalBinner(n_bins=2).partial_fit(pd.Series([4, 5, 6]))
+    binner = left.merge(right).freeze()
+
+    assert binner.edges[0] == 1 and binner.edges[-1] == 6
+    assert list(binner.encode(pd.Series([1, 6]))) == [0, 1]
+
+def test_binner_errors():
+    """Test handling of invalid binner usage"""
+    with pytest.raises(ValueError):
+        CategoricalBinner(n_bins=0)
+    with pytest.raises(ValueError):
+        CategoricalBinner(n_bins=2, strategy='invalid_strategy')
+    with pytest.raises(ValueError):
+        CategoricalBinner(n_bins=3, labels=['Low', 'High'])
+    with pytest.raises(ValueError):
+        CategoricalBinner(n_bins=3).freeze()
+    with pytest.raises(ValueError):
+        CategoricalBinner(n_bins=3).transform(pd.Series([1]))
+    with pytest.raises(ValueError):
+        CategoricalBinner.from_edges([0, 5, 5])
+    with pytest.raises(ValueError):
+        CategoricalBinner.from_edges([0, 5]).partial_fit(pd.Series([1]))
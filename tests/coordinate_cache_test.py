@@ -0,0 +1,112 @@
+import os
+import pytest
+import pandas as pd
+import numpy as np
+import h3
+
+from src.cdpg_anonkit.cache import CoordinateCache
+from src.cdpg_anonkit.generalisation import GeneraliseData
+
+spatial_generaliser = GeneraliseData().SpatialGeneraliser()
+
+@pytest.fixture
+def locations():
+    return pd.Series(['[12.9716, 77.5946]', '[28.7041, 77.1025]', '[19.0760, 72.8777]'], index=[10, 11, 12], name='location')
+
+@pytest.fixture
+def cache(tmp_path):
+    return CoordinateCache(str(tmp_path / 'cache'))
+
+def test_format_coordinates_matches_uncached(cache, locations):
+    """Cached parsing should return the same values, index and name on a miss and a hit"""
+    expected_lat, expected_lon = spatial_generaliser.format_coordinates(locations)
+    for _ in range(2):
+        lat, lon = cache.format_coordinates(locations)
+        pd.testing.assert_series_equal(lat, expected_lat)
+        pd.testing.assert_series_equal(lon, expected_lon)
+    assert len(os.listdir(cache.directory)) == 1
+
+def test_hit_skips_parsing(cache, locations, monkeypatch):
+    """A cache hit should not call the underlying function"""
+    cache.format_coordinates(locations)
+
+    def fail(series):
+        raise AssertionError("format_coordinates should not be called on a cache hit")
+    monkeypatch.setattr(GeneraliseData.SpatialGeneraliser, 'format_coordinates', fail)
+
+    lat, _ = cache.format_coordinates(locations.copy())
+    assert lat.iloc[0] == pytest.approx(12.9716)
+
+def test_generalise_spatial_matches_uncached(cache, locations):
+    lat, lon = cache.format_coordinates(locations)
+    expected = spatial_generaliser.generalise_spatial(lat, lon, 8)
+    for _ in range(2):
+        pd.testing.assert_series_equal(cache.generalise_spatial(lat, lon, 8), expected)
+
+    cells = cache.generalise_spatial(lat, lon, 8, as_int=True)
+    assert cells.dtype == np.uint64
+    assert [h3.int_to_str(int(cell)) for cell in cells] == list(expected)
+
+def test_generalise_spatial_hit_skips_h3(cache, locations, monkeypatch):
+    """A hit should format the cached integers without calling h3 for each row"""
+    lat, lon = cache.format_coordinates(locations)
+    expected = cache.generalise_spatial(lat, lon, 8)
+
+    def fail(*args):
+        raise AssertionError("h3 should not be called on a cache hit")
+    monkeypatch.setattr(h3, 'int_to_str', fail)
+    monkeypatch.setattr(h3, 'str_to_int', fail)
+    monkeypatch.setattr(h3, 'latlng_to_cell', fail)
+
+    pd.testing.assert_series_equal(cache.generalise_spatial(lat, lon, 8), expected)
+
+def test_results_are_writable_on_miss_and_hit(cache, locations):
+    """Results can be modified on a hit as on a miss, without changing the cached entry"""
+    for _ in range(2):
+        lat, lon = cache.format_coordinates(locations)
+        assert lat.iloc[0] == pytest.approx(12.9716)
+        lat.iloc[0] = 5.0
+        lon[lon > 0] = 0
+        assert lat.iloc[0] == 5.0
+
+        cells = cache.generalise_spatial(lat, lon, 8, as_int=True)
+        cells.iloc[0] = 0
+
+def test_parameters_are_part_of_the_key(cache, locations):
+    """Different inputs or resolutions must not share an entry"""
+    lat, lon = cache.format_coordinates(locations)
+    assert not cache.generalise_spatial(lat, lon, 7).equals(cache.generalise_spatial(lat, lon, 9))
+
+    other = locations.copy()
+    other.iloc[0] = '[13.0827, 80.2707]'
+    assert cache.format_coordinates(other)[0].iloc[0] == pytest.approx(13.0827)
+    assert CoordinateCache.fingerprint(locations) != CoordinateCache.fingerprint(other)
+    assert CoordinateCache.fingerprint(locations) == CoordinateCache.fingerprint(locations.reset_index(drop=True))
+
+def test_lru_eviction(tmp_path):
+    """The least recently used entries should be evicted to respect max_bytes"""
+    cache = CoordinateCache(str(tmp_path / 'cache'), max_bytes=1000)
+    first = pd.Series(['[1.0, 2.0]'] * 20)
+    second = pd.Series(['[3.0, 4.0]'] * 20)
+    third = pd.Series(['[5.0, 6.0]'] * 20)
+
+    cache.format_coordinates(first)
+    cache.format_coordinates(second)
+    first_path = cache._path(CoordinateCache.fingerprint(first, function='format_coordinates'))
+    second_path = cache._path(CoordinateCache.fingerprint(second, function='format_coordinates'))
+    os.utime(second_path, ns=(1, 1))  # make the second entry the least recently used
+    cache.format_coordinates(third)
+
+    assert cache.size <= 1000
+    assert os.path.exists(first_path)
+    assert not os.path.exists(second_path)
+
+def test_errors_are_not_cached(cache):
+    with pytest.raises(ValueError):
+        cache.format_coordinates(pd.Series(['invalid']))
+    assert cache.size == 0
+
+def test_clear(cache, locations):
+    cache.format_coordinates(locations)
+    cache.clear()
+    assert cache.size == 0
@@ -0,0 +1,127 @@
+import time
+import pytest
+import pandas as pd
+import numpy as np
+
+from src.cdpg_anonkit.generalisation import CategoricalBinner
+from src.cdpg_anonkit.error_evaluation import (
+    EquivalenceClassCounter,
+    AggregateErrorAccumulator,
+    discernibility,
+    average_class_size,
+    suppressed_fraction,
+    spatial_information_loss,
+    temporal_information_loss,
+    categorical_information_loss,
+    mean_absolute_error,
+    root_mean_squared_error,
+    mean_relative_error,
+)
+
+@pytest.fixture
+def generalised_df():
+    """Create a sample generalised DataFrame with three equivalence classes of sizes 3, 2 and 1."""
+    return pd.DataFrame({
+        'h3_index': ['a', 'a', 'a', 'b', 'b', 'c'],
+        'timeslot': ['10_0', '10_0', '10_0', '11_0', '11_0', '10_0'],
+        'value': [1, 2, 3, 4, 5, 6]
+    })
+
+def test_counter_is_incremental(generalised_df):
+    """Counting chunk by chunk should give the same classes as counting everything at once"""
+    whole = EquivalenceClassCounter(['h3_index', 'timeslot']).update(generalised_df)
+    chunked = EquivalenceClassCounter(['h3_index', 'timeslot'])
+    for start in range(0, len(generalised_df), 2):
+        chunked.update(generalised_df.iloc[start:start + 2])
+
+    pd.testing.assert_series_equal(whole.counts.sort_index(), chunked.counts.sort_index(), check_names=False)
+    assert chunked.n_rows == 6
+    assert chunked.n_classes == 3
+
+def test_counter_missing_columns(generalised_df):
+    with pytest.raises(ValueError, match="not found"):
+        EquivalenceClassCounter(['invalid_column']).update(generalised_df)
+    with pytest.raises(ValueError):
+        EquivalenceClassCounter([])
+
+def test_counter_update_does_not_scale_with_history():
+    """Adding a chunk should cost the same however many classes have been seen"""
+    chunk = pd.DataFrame({'h3_index': [f'new_{i % 1000}' for i in range(10_000)], 'timeslot': '10_0'})
+    history = pd.DataFrame({'h3_index': [f'seen_{i}' for i in range(500_000)], 'timeslot': '10_0'})
+
+    def update_time(counter):
+        start = time.perf_counter()
+        for _ in range(5):
+            counter.update(chunk)
+        return time.perf_counter() - start
+
+    update_time(EquivalenceClassCounter(['h3_index', 'timeslot']))
+    counter = EquivalenceClassCounter(['h3_index', 'timeslot']).update(history)
+    assert counter.n_classes == 500_000
+    assert update_time(counter) < 5 * update_time(EquivalenceClassCounter(['h3_index', 'timeslot'])) + 0.05
+    assert counter.n_classes == 501_000
+    assert counter.counts[('new_0', '10_0')] == 50
+    assert counter.n_rows == 550_000
+
+def test_class_metrics():
+    counts = pd.Series([3, 2, 1])
+
+    assert discernibility(counts) == 14
+    # the class of size 1 is suppressed and charged the dataset size
+    assert discernibility(counts, k=2) == 9 + 4 + 6
+    assert average_class_size(counts) == 2
+    assert average_class_size(counts, k=2) == 1
+    assert suppressed_fraction(counts, k=2) == pytest.approx(1 / 6)
+    assert np.isnan(average_class_size(pd.Series([], dtype='int64')))
+
+def test_spatial_information_loss():
+    """Coarser H3 resolutions should lose more information"""
+    assert spatial_information_loss(8) > spatial_information_loss(9)
+    assert spatial_information_loss(8, domain_area_km2=100) == pytest.approx(spatial_information_loss(8) / 100)
+    assert spatial_information_loss(0, domain_area_km2=100) == 1.0
+    with pytest.raises(ValueError):
+        spatial_information_loss(16)
+
+def test_temporal_information_loss():
+    assert temporal_information_loss(60) == pytest.approx(1 / 24)
+    assert temporal_information_loss(15) < temporal_information_loss(60)
+    with pytest.raises(ValueError):
+        temporal_information_loss(0)
+
+def test_categorical_information_loss():
+    assert categorical_information_loss([0, 5, 10, 20]) == pytest.approx((0.25 + 0.25 + 0.5) / 3)
+    assert categorical_information_loss([0, 5, 10, 20], bin_counts=[1, 1, 2]) == pytest.approx(0.375)
+    binner = CategoricalBinner.from_edges([0, 10, 20])
+    assert categorical_information_loss(binner) == pytest.approx(0.5)
+    with pytest.raises(ValueError):
+        categorical_information_loss([0, 5, 10], bin_counts=[1])
+
+def test_accuracy_metrics():
+    true = pd.Series([10, 20, 0], index=['a', 'b', 'c'])
+    noisy = pd.Series([12, 17, 1], index=['a', 'b', 'c'])
+
+    assert mean_absolute_error(true, noisy) == pytest.approx(2)
+    assert root_mean_squared_error(true, noisy) == pytest.approx(np.sqrt(14 / 3))
+    assert mean_relative_error(true, noisy) == pytest.approx((0.2 + 0.15 + 1) / 3)
+
+def test_accuracy_metrics_align_groups():
+    """Groups missing from one side should count as zero there"""
+    true = pd.Series([10, 5], index=['a', 'b'])
+    noisy = pd.Series([3, 10], index=['c', 'a'])
+
+    assert mean_absolute_error(true, noisy) == pytest.approx((0 + 5 + 3) / 3)
+    with pytest.raises(ValueError):
+        mean_absolute_error([1, 2], [1])
+
+def test_accumulator_is_incremental():
+    rng = np.random.default_rng(0)
+    true = rng.integers(0, 100, size=1000)
+    noisy = true + rng.laplace(scale=2, size=1000)
+
+    accumulator = AggregateErrorAccumulator()
+    for start in range(0, 1000, 100):
+        accumulator.update(true[start:start + 100], noisy[start:start + 100])
+
+    assert accumulator.mean_absolute_error == pytest.approx(mean_absolute_error(true, noisy))
+    assert accumulator.mean_relative_error == pytest.approx(mean_relative_error(true, noisy))
+    assert np.isnan(AggregateErrorAccumulator().mean_absolute_error)
@@ -0,0 +1,136 @@
+import json
+import tracemalloc
+import pytest
+import pandas as pd
+
+from src.cdpg_anonkit import instrumentation
+from src.cdpg_anonkit.instrumentation import profile, add_listener, remove_listener
+from src.cdpg_anonkit.sanitisation import SanitiseData
+from src.cdpg_anonkit.generalisation import GeneraliseData
+
+@pytest.fixture
+def sample_df():
+    """Create a sample DataFrame for testing."""
+    return pd.DataFrame({
+        'age': [25, 40, 15, 60, 18, 90],
+        'name': ['Alice', 'Bob', 'Charlie', 'David', 'Eve', 'Frank'],
+        'city': ['Pune', 'Pune', 'Delhi', 'Delhi', 'Goa', 'Pune']
+    })
+
+@pytest.fixture
+def rules():
+    return {
+        'age': {'method': 'clip', 'params': {'min_value': 18, 'max_value': 80}},
+        'name': {'method': 'hash', 'params': {'salt': 'test_salt'}},
+        'city': {'method': 'suppress', 'params': {'threshold': 2, 'replacement': 'Other'}}
+    }
+
+def test_sanitise_data_reports_each_rule(sample_df, rules):
+    """Each sanitisation rule should be reported as its own stage"""
+    with profile() as profiler:
+        SanitiseData.sanitise_data(sample_df, ['age', 'name', 'city'], rules)
+
+    stages = [(record.stage, record.column) for record in profiler.records]
+    assert stages == [('sanitise_data.clip', 'age'), ('sanitise_data.hash', 'name'), ('sanitise_data.suppress', 'city')]
+    city = profiler.records[2]
+    assert city.n_rows == 6
+    assert city.input_cardinality == 3
+    assert city.wall_time >= 0
+
+def test_generalisers_are_reported():
+    """Every generaliser function should be reported under its own name"""
+    with profile(track_memory=True) as profiler:
+        lat, lon = GeneraliseData.SpatialGeneraliser.format_coordinates(pd.Series(['[12.97, 77.59]', '[28.70, 77.10]']))
+        GeneraliseData.SpatialGeneraliser.generalise_spatial(lat, lon, 8)
+        GeneraliseData.TemporalGeneraliser.generalise_temporal(pd.Series(['2024-01-01 10:30:00']), temporal_resolution=30)
+        GeneraliseData.CategoricalGeneraliser.generalise_categorical(pd.Series([1, 2, 3]), bins=2)
+
+    assert [record.stage for record in profiler.records] == [
+        'format_coordinates', 'generalise_spatial', 'generalise_temporal', 'generalise_categorical'
+    ]
+    assert all(record.peak_memory_delta is not None for record in profiler.records)
+
+def test_disabled_by_default(sample_df, rules):
+    """Nothing is recorded outside a profile block"""
+    with profile() as profiler:
+        pass
+    SanitiseData.sanitise_data(sample_df, ['age'], rules)
+
+    assert profiler.records == []
+    assert instrumentation._listeners == []
+
+def test_failed_stage_is_not_reported(sample_df):
+    """A stage that raises should propagate the error without reporting metrics"""
+    with profile() as profiler:
+        with pytest.raises(ValueError, match="Unknown sanitisation method"):
+            SanitiseData.sanitise_data(sample_df, ['age'], {'age': {'method': 'invalid_method'}})
+
+    assert profiler.records == []
+
+def test_callback_registry(sample_df, rules):
+    """Callbacks receive every record until they are removed"""
+    received = []
+    add_listener(received.append)
+    try:
+        SanitiseData.sanitise_data(sample_df, ['age', 'name'], rules)
+    finally:
+        remove_listener(received.append)
+    SanitiseData.sanitise_data(sample_df, ['age'], rules)
+
+    assert len(received) == 2
+    assert received[0].input_cardinality is None
+    with pytest.raises(ValueError):
+        remove_listener(received.append)
+
+def test_exports(sample_df, rules):
+    """Records should export as JSON lines and Prometheus text"""
+    with profile() as profiler:
+        SanitiseData.sanitise_data(sample_df, ['age', 'name'], rules)
+        SanitiseData.sanitise_data(sample_df, ['age'], rules)
+
+    lines = profiler.to_json_lines().splitlines()
+    assert len(lines) == 3
+    assert json.loads(lines[0])['stage'] == 'sanitise_data.clip'
+
+    prometheus = profiler.to_prometheus()
+    assert '# TYPE cdpg_anonkit_stage_seconds_total counter' in prometheus
+    assert 'cdpg_anonkit_stage_calls_total{stage="sanitise_data.clip",column="age"} 2' in prometheus
+    assert 'cdpg_anonkit_stage_rows_total{stage="sanitise_data.hash",column="name"} 6' in prometheus
+    assert 'stage_peak_memory_bytes{' not in prometheus
+
+def test_prometheus_escapes_label_values(sample_df, rules):
+    """Quotes, backslashes and newlines in column names must not break the exposition text"""
+    column = 'a "b"\\c\nd'
+    df = sample_df.rename(columns={'age': column})
+    with profile() as profiler:
+        SanitiseData.sanitise_data(df, [column], {column: rules['age']})
+
+    prometheus = profiler.to_prometheus()
+    assert 'cdpg_anonkit_stage_calls_total{stage="sanitise_data.clip",column="a \\"b\\"\\\\c\\nd"} 1' in prometheus
+    assert all(line.startswith(('#', 'cdpg_anonkit_')) for line in prometheus.splitlines())
+
+def test_memory_tracking_keeps_outer_peak():
+    """A stage must not reset the peak of tracing it did not start, or of an enclosing stage"""
+    size = 20_000_000
+
+    tracemalloc.start()
+    try:
+        block = bytearray(size)
+        del block
+        with profile(track_memory=True):
+            GeneraliseData.TemporalGeneraliser.format_timestamp(pd.Series(['2024-01-01 10:30:00']))
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    assert peak >= size
+
+    with profile(track_memory=True) as profiler:
+        with instrumentation.stage('outer'):
+            block = bytearray(size)
+            del block
+            with instrumentation.stage('inner'):
+                pass
+    inner, outer = profiler.records
+    assert inner.peak_memory_delta < size
+    assert outer.peak_memory_delta >= size
+    assert not tracemalloc.is_tracing()
@@ -0,0 +1,77 @@
+import os
+import subprocess
+import sys
+import pytest
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+def run_python(code: str) -> str:
+    """Run code in a fresh interpreter from the repository root and return its stdout"""
+    result = subprocess.run(
+        [sys.executable, '-c', code], cwd=REPO_ROOT, capture_output=True, text=True, check=True
+    )
+    return result.stdout
+
+def import_time_us(module: str) -> int:
+    """Cumulative import time of a module in microseconds, as reported by -X importtime"""
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+        cwd=REPO_ROOT, capture_output=True, text=True, check=True
+    )
+    for line in result.stderr.splitlines():
+        fields = [field.strip() for field in line.split('|')]
+        if len(fields) == 3 and fields[2] == module:
+            return int(fields[1])
+    raise AssertionError(f"No import time reported for {module}")
+
+def test_package_import_loads_no_heavy_dependencies():
+    """Importing the package should not import its submodules, pandas, numpy or h3"""
+    output = run_python(
+        "import sys, src.cdpg_anonkit\n"
+        "print(sorted(m for m in ('pandas', 'numpy', 'h3', 'src.cdpg_anonkit.sanitisation') if m in sys.modules))"
+    )
+    assert output.strip() == '[]'
+
+def test_sanitisation_does_not_load_h3():
+    """Using only the sanitiser should not pay for the h3 import"""
+    output = run_python(
+        "import sys, pandas as pd, src.cdpg_anonkit as anonkit\n"
+        "anonkit.SanitiseData.hash_values(pd.Series(['a']))\n"
+        "print('h3' in sys.modules, 'src.cdpg_anonkit.generalisation' in sys.modules)"
+    )
+    assert output.strip() == 'False False'
+
+def test_h3_loaded_on_first_spatial_generalisation():
+    output = run_python(
+        "import sys, pandas as pd, src.cdpg_anonkit as anonkit\n"
+        "before = 'h3' in sys.modules\n"
+        "anonkit.generalise_spatial(pd.Series([12.97]), pd.Series([77.59]), 8)\n"
+        "print(before, 'h3' in sys.modules)"
+    )
+    assert output.strip() == 'False True'
+
+def test_all_exports_resolve():
+    """Every name in __all__ should resolve, including through a star import"""
+    import src.cdpg_anonkit as anonkit
+    from src.cdpg_anonkit.generalisation import GeneraliseData
+
+    for name in anonkit.__all__:
+        assert getattr(anonkit, name) is not None
+    assert anonkit.generalise_spatial is GeneraliseData.SpatialGeneraliser.generalise_spatial
+    assert set(anonkit.__all__) <= set(dir(anonkit))
+
+    namespace = {}
+    exec('from src.cdpg_anonkit import *', namespace)
+    assert set(anonkit.__all__) <= set(namespace)
+
+def test_unknown_attribute():
+    import src.cdpg_anonkit as anonkit
+    with pytest.raises(AttributeError):
+        anonkit.invalid_attribute
+
+def test_import_time_benchmark():
+    """The lazy package import should cost a small fraction of importing the generaliser eagerly"""
+    lazy = import_time_us('src.cdpg_anonkit')
+    eager = import_time_us('src.cdpg_anonkit.generalisation')
+
+    assert lazy * 10 < eager
@@ -0,0 +1,78 @@
+import pytest
+import pandas as pd
+
+from src.cdpg_anonkit.sanitisation import SanitiseData
+from src.cdpg_anonkit.generalisation import CategoricalBinner
+from src.cdpg_anonkit.parallel import PartitionedExecutor, generalise_frame
+
+@pytest.fixture
+def sample_df():
+    """Create a sample DataFrame with location, time and sanitisable columns."""
+    return pd.DataFrame({
+        'location': ['[12.9716, 77.5946]', '[12.9720, 77.5950]', '[28.7041, 77.1025]', '[19.0760, 72.8777]'] * 3,
+        'timestamp': ['2024-01-01 10:30:00', '2024-01-01 11:29:00', '2024-01-01 08:59:00', '2024-01-01 06:01:00'] * 3,
+        'age': [25, 40, 15, 60, 18, 90, 22, 45, 50, 55, 70, 12],
+        'name': ['Alice', 'Bob', 'Charlie', 'David', 'Eve', 'Frank', 'Grace', 'Henry', 'Ivy', 'Jack', 'Kim', 'Leo'],
+        'city': ['Pune', 'Pune', 'Delhi', 'Mumbai', 'Pune', 'Delhi', 'Goa', 'Pune', 'Delhi', 'Mumbai', 'Pune', 'Agra']
+    })
+
+@pytest.fixture
+def rules():
+    sanitisation_rules = {
+        'age': {'method': 'clip', 'params': {'min_value': 18, 'max_value': 80}},
+        'name': {'method': 'hash', 'params': {'salt': 'test_salt'}},
+        'city': {'method': 'suppress', 'params': {'threshold': 2, 'replacement': 'Other'}}
+    }
+    generalisation_rules = {
+        'location': {'method': 'spatial', 'params': {'spatial_resolution': 7}},
+        'timestamp': {'method': 'temporal', 'params': {'temporal_resolution': 30}}
+    }
+    return sanitisation_rules, generalisation_rules
+
+def serial_pipeline(df, sanitisation_rules, generalisation_rules):
+    generalised = generalise_frame(df.copy(), generalisation_rules)
+    return SanitiseData.sanitise_data(generalised, ['age', 'name', 'city'], sanitisation_rules)
+
+@pytest.mark.parametrize("n_workers, n_partitions", [(1, 1), (1, 5), (2, 3)])
+def test_matches_serial_pipeline(sample_df, rules, n_workers, n_partitions):
+    """Partitioned results should be identical to running the pipeline on the whole frame"""
+    sanitisation_rules, generalisation_rules = rules
+    executor = PartitionedExecutor(n_workers=n_workers, n_partitions=n_partitions)
+    result = executor.run(sample_df, ['age', 'name', 'city'], sanitisation_rules, generalisation_rules)
+
+    pd.testing.assert_frame_equal(result, serial_pipeline(sample_df, sanitisation_rules, generalisation_rules))
+
+def test_suppression_uses_global_counts(sample_df, rules):
+    """Values that are rare within a partition but common overall must not be suppressed"""
+    sanitisation_rules, _ = rules
+    executor = PartitionedExecutor(n_workers=1, n_partitions=12)
+    result = executor.run(sample_df, ['city'], sanitisation_rules)
+
+    assert 'Pune' in result['city'].values
+    assert 'Goa' not in result['city'].values
+    assert (result['city'] == 'Other').sum() == 2
+
+def test_categorical_requires_explicit_edges(sample_df):
+    """Integer bins give each partition different edges, so they are rejected"""
+    executor = PartitionedExecutor(n_workers=1, n_partitions=2)
+    with pytest.raises(ValueError, match="explicit bin edges"):
+        executor.run(sample_df, [], {}, {'age': {'method': 'categorical', 'params': {'bins': 3}}})
+
+def test_categorical_with_binner(sample_df):
+    """A fitted binner gives every partition the same categories"""
+    binner = CategoricalBinner(n_bins=3, strategy='uniform', labels=['young', 'middle', 'old']).fit(sample_df['age'])
+    executor = PartitionedExecutor(n_workers=1, n_partitions=4)
+    result = executor.run(sample_df, [], {}, {'age': {'method': 'categorical', 'params': {'bins': binner}}})
+
+    assert list(result['age'].cat.categories) == ['young', 'middle', 'old']
+    assert result['age'].notna().all()
+
+def test_error_handling(sample_df):
+    """Test error handling for missing columns and rules"""
+    executor = PartitionedExecutor(n_workers=1)
+    with pytest.raises(ValueError, match="Column 'invalid_column' not found"):
+        executor.run(sample_df, ['invalid_column'], {})
+    with pytest.raises(ValueError, match="No sanitisation rule"):
+        executor.run(sample_df, ['age'], {})
+    with pytest.raises(ValueError, match="Unknown generalisation method"):
+        executor.run(sample_df, [], {}, {'age': {'method': 'invalid_method'}})
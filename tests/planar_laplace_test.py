@@ -0,0 +1,90 @@
+import pytest
+import pandas as pd
+import numpy as np
+import h3
+
+from src.cdpg_anonkit.differential_privacy import (
+    lambert_w_minus1,
+    planar_laplace_radius,
+    planar_laplace,
+    planar_laplace_to_h3,
+)
+from src.cdpg_anonkit.differential_privacy.planar_laplace import EARTH_RADIUS_M
+
+@pytest.fixture
+def coordinates():
+    rng = np.random.default_rng(0)
+    latitude = pd.Series(rng.uniform(8, 35, 10_000), name='latitude', index=np.arange(10_000) + 100)
+    longitude = pd.Series(rng.uniform(68, 97, 10_000), name='longitude', index=np.arange(10_000) + 100)
+    return latitude, longitude
+
+def haversine_m(lat1, lon1, lat2, lon2):
+    lat1, lon1, lat2, lon2 = map(np.radians, (lat1, lon1, lat2, lon2))
+    a = np.sin((lat2 - lat1) / 2) ** 2 + np.cos(lat1) * np.cos(lat2) * np.sin((lon2 - lon1) / 2) ** 2
+    return 2 * EARTH_RADIUS_M * np.arcsin(np.sqrt(a))
+
+def test_lambert_w_minus1():
+    """W_{-1}(x) * exp(W_{-1}(x)) should give back x on the whole branch"""
+    x = np.array([-1 / np.e, -0.36, -0.3, -0.25, -0.1, -1e-5, -1e-100])
+    w = lambert_w_minus1(x)
+
+    assert w[0] == pytest.approx(-1)
+    assert (w <= -1).all()
+    assert w * np.exp(w) == pytest.approx(x, rel=1e-12)
+    with pytest.raises(ValueError):
+        lambert_w_minus1(np.array([0.1]))
+
+def test_radius_distribution():
+    """Planar Laplace radii follow a Gamma(2, 1/epsilon) distribution with mean 2/epsilon"""
+    radius = planar_laplace_radius(np.random.default_rng(1).random(200_000), epsilon=0.01)
+
+    assert radius.min() >= 0
+    assert radius.mean() == pytest.approx(200, rel=0.02)
+    assert np.median(radius) == pytest.approx(167.8, rel=0.02)
+
+def test_perturbation_distances(coordinates):
+    """The distances moved should match the planar Laplace radius distribution"""
+    latitude, longitude = coordinates
+    new_latitude, new_longitude = planar_laplace(latitude, longitude, epsilon=np.log(4), radius_m=200, seed=42)
+    distance = haversine_m(latitude, longitude, new_latitude, new_longitude)
+
+    assert distance.mean() == pytest.approx(2 * 200 / np.log(4), rel=0.05)
+    assert list(new_latitude.index) == list(latitude.index)
+    assert new_latitude.name == 'latitude' and new_longitude.name == 'longitude'
+
+def test_seeded_streams(coordinates):
+    """The same seed gives the same output regardless of the number of threads"""
+    latitude, longitude = coordinates
+    first = planar_laplace(latitude, longitude, epsilon=0.01, seed=7, chunk_size=1_000)
+    second = planar_laplace(latitude, longitude, epsilon=0.01, seed=7, chunk_size=1_000, n_threads=4)
+    other = planar_laplace(latitude, longitude, epsilon=0.01, seed=8, chunk_size=1_000)
+
+    pd.testing.assert_series_equal(first[0], second[0])
+    pd.testing.assert_series_equal(first[1], second[1])
+    assert not first[0].equals(other[0])
+
+def test_output_stays_in_range():
+    """Points near the poles and the antimeridian should stay valid coordinates"""
+    latitude = pd.Series([89.9999, -89.9999, 0.0, 0.0])
+    longitude = pd.Series([0.0, 0.0, 179.9999, -179.9999])
+    new_latitude, new_longitude = planar_laplace(latitude, longitude, epsilon=1e-4, seed=0)
+
+    assert new_latitude.between(-90, 90).all()
+    assert new_longitude.between(-180, 180).all()
+
+def test_snap_to_h3(coordinates):
+    latitude, longitude = coordinates
+    cells = planar_laplace_to_h3(latitude, longitude, epsilon=np.log(4), spatial_resolution=8, radius_m=200, seed=1)
+
+    assert len(cells) == len(latitude)
+    assert cells.name == 'h3_index'
+    assert all(h3.is_valid_cell(cell) and h3.get_resolution(cell) == 8 for cell in cells.head(100))
+
+def test_error_handling(coordinates):
+    latitude, longitude = coordinates
+    with pytest.raises(ValueError):
+        planar_laplace(latitude, longitude, epsilon=0)
+    with pytest.raises(ValueError):
+        planar_laplace(latitude, longitude.iloc[:10], epsilon=1)
+    with pytest.raises(ValueError, match="Latitude values"):
+        planar_laplace(pd.Series([91.0]), pd.Series([0.0]), epsilon=1)
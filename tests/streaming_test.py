@@ -0,0 +1,113 @@
+import asyncio
+import time
+import pytest
+import pandas as pd
+
+from src.cdpg_anonkit.streaming import MicroBatchAnonymiser, InProcessSource
+
+RULES = {
+    'age': {'method': 'clip', 'params': {'min_value': 18, 'max_value': 80}},
+    'name': {'method': 'hash', 'params': {'salt': 'test_salt'}},
+    'city': {'method': 'suppress', 'params': {'threshold': 2, 'replacement': 'Other'}}
+}
+
+def messages(n):
+    cities = ['Pune', 'Delhi', 'Pune', 'Goa', 'Delhi', 'Pune']
+    return [
+        {'age': 10 + 10 * (i % 9), 'name': f'user_{i}', 'city': cities[i % len(cities)],
+         'timestamp': f'2024-01-01 {i % 24:02d}:{(7 * i) % 60:02d}:00'}
+        for i in range(n)
+    ]
+
+async def produce(source, items, delay=0):
+    for item in items:
+        await source.put(item)
+        if delay:
+            await asyncio.sleep(delay)
+    await source.close()
+
+async def consume(anonymiser, source, items, delay=0):
+    producer = asyncio.create_task(produce(source, items, delay))
+    batches = [batch async for batch in anonymiser.stream(source)]
+    await producer
+    return batches
+
+def test_size_bounded_batches():
+    """Batches should hold at most max_batch_size rows and cover every message in order"""
+    anonymiser = MicroBatchAnonymiser(['age', 'name'], RULES, max_batch_size=4, max_latency=10)
+    batches = asyncio.run(consume(anonymiser, InProcessSource(), messages(10)))
+
+    assert [len(batch) for batch in batches] == [4, 4, 2]
+    result = pd.concat(batches)
+    assert result['age'].between(18, 80).all()
+    assert not result['name'].str.startswith('user_').any()
+    assert list(result['timestamp']) == [m['timestamp'] for m in messages(10)]
+
+def test_time_bounded_batches():
+    """A slow trickle of messages should be flushed by the latency bound"""
+    anonymiser = MicroBatchAnonymiser(['age'], RULES, max_batch_size=100, max_latency=0.01)
+    batches = asyncio.run(consume(anonymiser, InProcessSource(), messages(3), delay=0.05))
+
+    assert [len(batch) for batch in batches] == [1, 1, 1]
+
+def test_generalisation_rules():
+    anonymiser = MicroBatchAnonymiser(
+        ['age'], RULES, {'timestamp': {'method': 'temporal', 'params': {'temporal_resolution': 30}}}, max_batch_size=5
+    )
+    result = pd.concat(asyncio.run(consume(anonymiser, InProcessSource(), messages(5))))
+
+    assert list(result['timestamp']) == ['0_0', '1_0', '2_0', '3_0', '4_0']
+
+def test_suppression_counts_carry_across_batches():
+    """A value is suppressed until its running count over the stream reaches the threshold"""
+    anonymiser = MicroBatchAnonymiser(['city'], RULES, max_batch_size=2, max_latency=10)
+    result = pd.concat(asyncio.run(consume(anonymiser, InProcessSource(), messages(6))))
+
+    # Pune, Delhi | Pune, Goa | Delhi, Pune
+    assert list(result['city']) == ['Other', 'Other', 'Pune', 'Other', 'Delhi', 'Pune']
+    assert dict(anonymiser.counts['city']) == {'Pune': 3, 'Delhi': 2, 'Goa': 1}
+
+    # the counts persist into the next stream
+    result = pd.concat(asyncio.run(consume(anonymiser, InProcessSource(), messages(4)[3:])))
+    assert list(result['city']) == ['Goa']
+
+def test_state_update_does_not_scale_with_history():
+    """Applying a batch should cost the same however many distinct values have been seen"""
+    batch = pd.DataFrame({'city': [f'new_{i % 100}' for i in range(1000)]})
+    counts = {'city': batch['city'].value_counts()}
+
+    def apply_time(history_size):
+        anonymiser = MicroBatchAnonymiser(['city'], RULES)
+        anonymiser.counts['city'].update({f'seen_{i}': 1 for i in range(history_size)})
+        start = time.perf_counter()
+        for _ in range(5):
+            anonymiser._apply_state(batch.copy(), counts)
+        return time.perf_counter() - start
+
+    apply_time(0)
+    assert apply_time(500_000) < 5 * apply_time(0) + 0.05
+
+def test_backpressure():
+    """A consumer that stops reading should stop the anonymiser from draining the source"""
+    async def scenario():
+        source = InProcessSource(maxsize=1)
+        anonymiser = MicroBatchAnonymiser(['age'], RULES, max_batch_size=1, max_latency=0, max_pending_batches=1)
+        producer = asyncio.create_task(produce(source, messages(100)))
+        stream = anonymiser.stream(source)
+        await stream.__anext__()
+        await asyncio.sleep(0.1)
+        blocked = not producer.done()
+        await stream.aclose()
+        producer.cancel()
+        return blocked
+
+    assert asyncio.run(scenario())
+
+def test_errors_propagate():
+    """Pipeline errors should surface to the consumer"""
+    anonymiser = MicroBatchAnonymiser(['age'], {'age': {'method': 'invalid_method'}})
+    with pytest.raises(ValueError, match="Unknown sanitisation method"):
+        asyncio.run(consume(anonymiser, InProcessSource(), messages(3)))
+
+    with pytest.raises(ValueError, match="No sanitisation rule"):
+        MicroBatchAnonymiser(['age'], {})
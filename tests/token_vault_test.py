@@ -0,0 +1,91 @@
+import pickle
+import pytest
+import pandas as pd
+import numpy as np
+
+from src.cdpg_anonkit.vault import TokenVault
+from src.cdpg_anonkit.sanitisation import SanitiseData
+from src.cdpg_anonkit.parallel import PartitionedExecutor
+
+@pytest.fixture
+def vault_path(tmp_path):
+    return str(tmp_path / 'tokens.db')
+
+def test_tokens_are_compact_and_consistent(vault_path):
+    """Repeated values should share a token, and distinct values get distinct int64 tokens"""
+    with TokenVault(vault_path, key='test_key') as vault:
+        result = vault.tokenise(pd.Series(['Alice', 'Bob', 'Alice', None, 'Eve'], name='name', index=list('abcde')))
+
+    assert str(result.dtype) == 'Int64'
+    assert result.name == 'name'
+    assert list(result.index) == list('abcde')
+    assert result['a'] == result['c']
+    assert len({result['a'], result['b'], result['e']}) == 3
+    assert pd.isna(result['d'])
+
+def test_tokens_are_stable_across_runs(vault_path):
+    """A reopened vault should return the same tokens and only add new values"""
+    with TokenVault(vault_path, key='test_key') as vault:
+        first = vault.tokenise(pd.Series(['Alice', 'Bob']))
+    with TokenVault(vault_path, key='test_key') as vault:
+        second = vault.tokenise(pd.Series(['Bob', 'Carol', 'Alice']))
+        assert len(vault) == 3
+
+    assert second.iloc[0] == first.iloc[1]
+    assert second.iloc[2] == first.iloc[0]
+    assert second.iloc[1] not in set(first)
+
+def test_key_changes_digests(vault_path):
+    vault = TokenVault(':memory:', key='key_one')
+    other = TokenVault(':memory:', key='key_two')
+    assert vault.digest('Alice') != other.digest('Alice')
+    assert vault.digest('Alice') == TokenVault(':memory:', key='key_one').digest('Alice')
+
+def test_lru_cache_is_bounded(vault_path):
+    """The cache should keep only the most recently used values"""
+    vault = TokenVault(vault_path, key='test_key', cache_size=2)
+    vault.tokenise(pd.Series(['a', 'b', 'c']))
+    assert list(vault._cache) == ['b', 'c']
+
+    vault.tokenise(pd.Series(['b', 'd']))
+    assert list(vault._cache) == ['b', 'd']
+
+def test_bulk_lookup_beyond_parameter_limit(vault_path):
+    """Tokenising more unique values than SQLite binds per statement should work"""
+    series = pd.Series(np.arange(5000)).astype(str)
+    vault = TokenVault(vault_path, key='test_key', cache_size=10)
+    first = vault.tokenise(series)
+    second = vault.tokenise(series)
+
+    assert first.nunique() == 5000
+    assert (first == second).all()
+
+def test_read_only_vault(vault_path):
+    """A read-only vault should return null for unknown values and never insert"""
+    TokenVault(vault_path, key='test_key').tokenise(pd.Series(['Alice']))
+    reader = TokenVault(vault_path, key='test_key', read_only=True)
+    result = reader.tokenise(pd.Series(['Alice', 'Mallory']))
+
+    assert result.iloc[0] == 1
+    assert pd.isna(result.iloc[1])
+    assert len(reader) == 1
+
+def test_pickled_vault_reopens(vault_path):
+    vault = TokenVault(vault_path, key='test_key')
+    token = vault.tokenise(pd.Series(['Alice'])).iloc[0]
+    clone = pickle.loads(pickle.dumps(vault))
+
+    assert clone.tokenise(pd.Series(['Alice'])).iloc[0] == token
+    with pytest.raises(TypeError):
+        pickle.dumps(TokenVault(':memory:', key='test_key'))
+
+def test_tokenise_rule(vault_path):
+    """sanitise_data and the partitioned executor should accept the tokenise method"""
+    df = pd.DataFrame({'name': ['Alice', 'Bob', 'Alice', 'Eve'] * 3})
+    rules = {'name': {'method': 'tokenise', 'params': {'vault': TokenVault(vault_path, key='test_key')}}}
+
+    serial = SanitiseData.sanitise_data(df, ['name'], rules)
+    parallel = PartitionedExecutor(n_workers=2, n_partitions=3).run(df, ['name'], rules)
+
+    pd.testing.assert_frame_equal(serial, parallel)
+    assert serial['name'].nunique() == 3
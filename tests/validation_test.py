@@ -0,0 +1,120 @@
+import pytest
+import pandas as pd
+import numpy as np
+
+from src.cdpg_anonkit import validation
+from src.cdpg_anonkit.validation import ValidateData
+from src.cdpg_anonkit.generalisation import GeneraliseData
+
+validator = ValidateData()
+
+@pytest.fixture
+def sample_df():
+    """Create a sample DataFrame with one kind of bad value per row."""
+    return pd.DataFrame({
+        'location': ['[40.7128, -74.0060]', 'invalid', '[100.0, 0.0]', '[51.5074, -0.1278]', None, '[12.97, 77.59]'],
+        'timestamp': ['2024-01-01 10:30:00', '2024-01-01 11:29:00', '2024-01-01 08:59:00', 'not a time', '2024-01-01 06:01:00', '2024-01-01 06:01:00'],
+        'age': [25, 40, 15, 60, 18, 200]
+    }, index=list('abcdef'))
+
+RULES = {
+    'location': {'check': 'coordinates'},
+    'timestamp': {'check': 'timestamp'},
+    'age': {'check': 'range', 'params': {'min_value': 0, 'max_value': 120}}
+}
+
+def test_parse_coordinates_matches_format_coordinates():
+    """Valid rows should parse to the same values as format_coordinates"""
+    data = pd.Series(['[40.7128, -74.0060]', '[  51.5074,-0.1278  ]', '[1.23e-2, 4.56e1]'])
+    lat, lon, reason = validator.parse_coordinates(data)
+    expected_lat, expected_lon = GeneraliseData.SpatialGeneraliser.format_coordinates(data)
+
+    assert reason.isna().all()
+    assert lat.tolist() == pytest.approx(expected_lat.tolist())
+    assert lon.tolist() == pytest.approx(expected_lon.tolist())
+
+def test_coordinate_reasons():
+    data = pd.Series(['[40.7, -74.0]', '40.7, -74.0, 1', '[abc, 1]', '[-91, 0]', '[0, 181]', np.nan])
+    reason = validator.coordinates_reason(data)
+
+    assert reason.tolist() == [
+        None, validation.INVALID_COORDINATE, validation.INVALID_COORDINATE,
+        validation.LATITUDE_OUT_OF_RANGE, validation.LONGITUDE_OUT_OF_RANGE, validation.MISSING
+    ]
+
+def test_latitude_longitude_reasons():
+    assert validator.latitude_reason(pd.Series([0, 91, -90])).tolist() == [None, validation.LATITUDE_OUT_OF_RANGE, None]
+    assert validator.longitude_reason(pd.Series([180, -181, None])).tolist() == [None, validation.LONGITUDE_OUT_OF_RANGE, validation.MISSING]
+
+def test_quarantine_splits_rows(sample_df):
+    """Invalid rows should be quarantined with the first failing column and reason"""
+    clean, rejected = validator.quarantine(sample_df, RULES)
+
+    assert list(clean.index) == ['a']
+    assert list(rejected.index) == ['b', 'c', 'd', 'e', 'f']
+    assert rejected['quarantine_column'].tolist() == ['location', 'location', 'timestamp', 'location', 'age']
+    assert rejected['quarantine_reason'].tolist() == [
+        validation.INVALID_COORDINATE, validation.LATITUDE_OUT_OF_RANGE, validation.INVALID_TIMESTAMP,
+        validation.MISSING, validation.OUT_OF_RANGE
+    ]
+    assert list(clean.columns) == list(sample_df.columns)
+
+def test_clean_rows_pass_generalisation(sample_df):
+    """The rows that pass validation should go through the generalisers without errors"""
+    clean, _ = validator.quarantine(sample_df, RULES)
+    lat, lon = GeneraliseData.SpatialGeneraliser.format_coordinates(clean['location'])
+    assert len(GeneraliseData.SpatialGeneraliser.generalise_spatial(lat, lon, 8)) == len(clean)
+    assert len(GeneraliseData.TemporalGeneraliser.generalise_temporal(clean['timestamp'])) == len(clean)
+
+def test_padded_and_mixed_rows_pass_generalisation():
+    """Padded coordinates and timestamps in another format are quarantined, not passed on to crash"""
+    df = pd.DataFrame({
+        'location': [' [40.7, -74.0]', '[40.7, -74.0] ', '[ 40.7 , -74.0 ]', '[40.7, -74.0]', '[51.5, -0.1]', '[12.9, 77.5]'],
+        'timestamp': ['not a time', '2024-01-01 10:30:00', '2024-01-01 10:30:00', '2024-01-01 10:30:00', '2024/01/02 11:45', '2024-01-01T06:01:00']
+    })
+    clean, rejected = validator.quarantine(df, {'location': {'check': 'coordinates'}, 'timestamp': {'check': 'timestamp'}})
+
+    assert list(clean.index) == [2, 3]
+    assert rejected['quarantine_reason'].tolist() == [
+        validation.INVALID_COORDINATE, validation.INVALID_COORDINATE, validation.INVALID_TIMESTAMP, validation.INVALID_TIMESTAMP
+    ]
+    lat, lon = GeneraliseData.SpatialGeneraliser.format_coordinates(clean['location'])
+    assert len(GeneraliseData.SpatialGeneraliser.generalise_spatial(lat, lon, 8)) == 2
+    assert GeneraliseData.TemporalGeneraliser.generalise_temporal(clean['timestamp']).tolist() == ['10_0', '10_0']
+
+def test_parse_timestamps_follows_inferred_format():
+    data = pd.Series([None, '2024-01-01 10:30:00', '2024/01/02 11:45', 'garbage'])
+    parsed = validator.parse_timestamps(data)
+
+    assert parsed.isna().tolist() == [True, False, True, True]
+    assert parsed[1] == pd.Timestamp('2024-01-01 10:30:00')
+
+def test_parse_timestamps_bounds_format_guessing(monkeypatch):
+    """Only a few leading values are used to infer the format; otherwise it warns and falls back"""
+    calls = []
+    def counting_guess(value):
+        calls.append(value)
+        return None
+    monkeypatch.setattr(validation, 'guess_datetime_format', counting_guess)
+
+    data = pd.Series(['junk'] * 1000 + ['2024-01-01 10:30:00'], name='timestamp')
+    with pytest.warns(UserWarning, match="Could not infer a timestamp format for column 'timestamp'"):
+        parsed = validator.parse_timestamps(data)
+
+    assert len(calls) == validation._FORMAT_GUESS_ROWS
+    assert parsed.isna().sum() == 1000
+    assert parsed.iloc[-1] == pd.Timestamp('2024-01-01 10:30:00')
+
+def test_quarantine_all_valid():
+    df = pd.DataFrame({'age': [1, 2, 3]})
+    clean, rejected = validator.quarantine(df, {'age': {'check': 'not_null'}})
+
+    assert len(clean) == 3
+    assert len(rejected) == 0
+    assert list(rejected.columns) == ['age', 'quarantine_column', 'quarantine_reason']
+
+def test_error_handling(sample_df):
+    with pytest.raises(ValueError, match="Column 'invalid_column' not found"):
+        validator.quarantine(sample_df, {'invalid_column': {'check': 'not_null'}})
+    with pytest.raises(ValueError, match="Unknown validation check"):
+        validator.quarantine(sample_df, {'age': {'check': 'invalid_check'}})